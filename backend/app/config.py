@@ -1,16 +1,26 @@
 from __future__ import annotations
 
+import os
 import secrets
-from functools import lru_cache
-from typing import List, Literal
+from datetime import timedelta
+from functools import cached_property
+from typing import Literal, Tuple
 
 from pydantic import Field, field_validator, model_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
-from sqlalchemy.engine import URL
+
+_SECURE_ENVS: frozenset[str] = frozenset(("production", "staging"))
+_DB_FIELDS = ("database_host", "database_port", "database_user", "database_password", "database_name")
 
 
 class Settings(BaseSettings):
-    model_config = SettingsConfigDict(env_file=".env", env_prefix="APP_", extra="ignore")
+    # Deployed environments inject variables directly; only local development reads .env.
+    model_config = SettingsConfigDict(
+        env_file=".env" if os.getenv("APP_ENVIRONMENT", "development") == "development" else None,
+        env_prefix="APP_",
+        extra="ignore",
+        frozen=True,
+    )
 
     secret_key: str = Field(
         default_factory=lambda: secrets.token_urlsafe(48),  # ensures >=32 chars for local dev
@@ -18,7 +28,7 @@ class Settings(BaseSettings):
     )
     algorithm: str = Field(default="HS256", description="JWT algorithm")
     access_token_expire_minutes: int = Field(default=1440, description="Token expiration in minutes")
-    cors_origins: List[str] | str = Field(default=[], description="Allowed CORS origins")
+    cors_origins: Tuple[str, ...] | str = Field(default=(), description="Allowed CORS origins")
     environment: Literal["development", "staging", "production", "test"] = Field(
         default="development", description="Application environment"
     )
@@ -39,48 +49,68 @@ class Settings(BaseSettings):
     database_password: str | None = Field(default=None, description="PostgreSQL password")
     database_name: str | None = Field(default=None, description="PostgreSQL database name")
     database_ssl_mode: str | None = Field(default=None, description="PostgreSQL sslmode query parameter")
+    database_pool_size: int = Field(default=5, description="Persistent connections kept open per process")
+    database_max_overflow: int = Field(default=10, description="Extra connections allowed per process during bursts")
 
     @field_validator("cors_origins")
     @classmethod
-    def split_origins(cls, v: List[str] | str) -> List[str]:
+    def split_origins(cls, v: Tuple[str, ...] | str) -> Tuple[str, ...]:
         if isinstance(v, str):
-            return [origin.strip() for origin in v.split(",") if origin.strip()]
-        return v
+            return tuple(filter(None, (origin.strip() for origin in v.split(","))))
+        return tuple(v)
 
     @model_validator(mode="after")
-    def validate_secure_config(self) -> "Settings":
-        """Ensure secure configuration in production/staging environments."""
-        if self.environment in {"production", "staging"}:
+    def validate_settings(self) -> "Settings":
+        """Run every cross-field check in a single validator pass."""
+        # Ensure secure configuration in production/staging environments.
+        if self.environment in _SECURE_ENVS:
             # Check for insecure default secret keys
             if len(self.secret_key) < 32:
                 raise ValueError(
                     f"APP_SECRET_KEY must be a secure random string (at least 32 characters) "
                     f"in {self.environment} environment"
                 )
-            
+
             # Ensure secure cookie settings for production
             if self.auth_cookie_secure is not True and self.environment == "production":
                 raise ValueError("APP_AUTH_COOKIE_SECURE must be true in production environment")
-        
+
+        if self.demo_user_enabled:
+            if not self.demo_username or not self.demo_username.strip():
+                raise ValueError("APP_DEMO_USERNAME must be provided when demo user is enabled")
+
+            if not self.demo_password or not self.demo_password.strip():
+                raise ValueError("APP_DEMO_PASSWORD must be provided when demo user is enabled")
+
+            demo_password = self.demo_password
+            # ASCII strings are one byte per character, so only encode when needed.
+            password_bytes = len(demo_password) if demo_password.isascii() else len(demo_password.encode("utf-8"))
+            if password_bytes > 72:
+                raise ValueError("APP_DEMO_PASSWORD must be at most 72 bytes when UTF-8 encoded")
+
+            if self.demo_user_ttl_hours <= 0:
+                raise ValueError("APP_DEMO_USER_TTL_HOURS must be a positive integer")
+
         return self
 
-    @model_validator(mode="after")
-    def validate_database_config(self) -> "Settings":
-        """Ensure a full SQLAlchemy connection string is available."""
-        if self.environment == "test":
-            return self
+    @cached_property
+    def access_token_expire_delta(self) -> timedelta:
+        """Token lifetime, built once instead of on every token issue."""
+        return timedelta(minutes=self.access_token_expire_minutes)
+
+    @cached_property
+    def database_url_resolved(self) -> str:
+        """Full SQLAlchemy connection string, assembled from parts on first access.
+
+        A plain property rather than a computed field, so dumping settings never
+        trips the missing-configuration error.
+        """
+        from sqlalchemy.engine import URL
+
         if self.database_url:
-            return self
-
-        required_fields = {
-            "database_host": self.database_host,
-            "database_port": self.database_port,
-            "database_user": self.database_user,
-            "database_password": self.database_password,
-            "database_name": self.database_name,
-        }
+            return self.database_url
 
-        missing = [field for field, value in required_fields.items() if value in {None, ""}]
+        missing = [field for field in _DB_FIELDS if getattr(self, field) in (None, "")]
         if missing:
             missing_env = ", ".join(f"APP_{field.upper()}" for field in missing)
             raise ValueError(f"Provide APP_DATABASE_URL or all of {missing_env} to configure the database")
@@ -102,31 +132,11 @@ class Settings(BaseSettings):
             url_kwargs["query"] = query
 
         url = URL.create(**url_kwargs)
+        return url.render_as_string(hide_password=False)
 
-        # Persist the assembled DSN so downstream code can keep using database_url.
-        self.database_url = url.render_as_string(hide_password=False)
-        return self
-
-    @model_validator(mode="after")
-    def validate_demo_user_config(self) -> "Settings":
-        if not self.demo_user_enabled:
-            return self
-
-        if not self.demo_username or not self.demo_username.strip():
-            raise ValueError("APP_DEMO_USERNAME must be provided when demo user is enabled")
-
-        if not self.demo_password or not self.demo_password.strip():
-            raise ValueError("APP_DEMO_PASSWORD must be provided when demo user is enabled")
-
-        if len(self.demo_password.encode("utf-8")) > 72:
-            raise ValueError("APP_DEMO_PASSWORD must be at most 72 bytes when UTF-8 encoded")
 
-        if self.demo_user_ttl_hours <= 0:
-            raise ValueError("APP_DEMO_USER_TTL_HOURS must be a positive integer")
-
-        return self
+settings: Settings = Settings()  # type: ignore[call-arg]
 
 
-@lru_cache
 def get_settings() -> Settings:
-    return Settings()  # type: ignore[call-arg]
+    return settings
@@ -1,29 +1,47 @@
 from __future__ import annotations
 
+from contextlib import ExitStack
+
 from sqlalchemy import create_engine, text
 from sqlalchemy.orm import Session, sessionmaker
 
 from loguru import logger
 
-from .config import get_settings
+from .config import settings
 from .datastore import Datastore, InMemoryDataStore, PostgresDataStore
 from .orm_models import Base
 
 _engine = None
 SessionLocal = None
 
+# Settings are frozen, so the environment can be resolved once for every request.
+_IS_TEST = settings.environment == "test"
+
 _DB_CONNECT_TIMEOUT = 10  # seconds before giving up on a new connection
+_DB_POOL_RECYCLE = 1800  # seconds before a pooled connection is replaced
+# Connections opened per process at startup. Kept small: every worker warms its own
+# pool, and the rest of pool_size still opens lazily under load.
+_DB_POOL_WARM_CONNECTIONS = 2
 
 def init_db():
     global _engine, SessionLocal
-    settings = get_settings()
-    if settings.environment == "test":
+    if _IS_TEST:
         return
-    _engine = create_engine(
-        settings.database_url,
-        connect_args={"connect_timeout": _DB_CONNECT_TIMEOUT},
-        pool_pre_ping=True,
-    )
+    database_url = settings.database_url_resolved
+    # Prefix check only: a substring scan could match "sqlite" inside a password.
+    is_sqlite = database_url.startswith("sqlite")
+    if is_sqlite:
+        engine_kwargs = {"connect_args": {"check_same_thread": False}}
+    else:
+        engine_kwargs = {
+            "connect_args": {"connect_timeout": _DB_CONNECT_TIMEOUT},
+            "pool_size": settings.database_pool_size,
+            "max_overflow": settings.database_max_overflow,
+            "pool_recycle": _DB_POOL_RECYCLE,
+            # Reuse the most recently returned connection so idle ones can age out.
+            "pool_use_lifo": True,
+        }
+    _engine = create_engine(database_url, pool_pre_ping=True, **engine_kwargs)
     # Verify connectivity before running DDL so we fail fast with a clear message.
     try:
         with _engine.connect() as conn:
@@ -34,13 +52,40 @@ def init_db():
             f"Check APP_DATABASE_* settings. Original error: {exc}"
         ) from exc
 
-    SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=_engine)
+    # Committed objects keep their loaded state so attribute reads after commit
+    # don't trigger a fresh SELECT per instance.
+    SessionLocal = sessionmaker(autocommit=False, autoflush=False, expire_on_commit=False, bind=_engine)
     Base.metadata.create_all(bind=_engine)
     logger.info("PostgreSQL schema verified/created OK")
+    if not is_sqlite:
+        _warm_pool(_engine, min(settings.database_pool_size, _DB_POOL_WARM_CONNECTIONS))
+
+
+def _warm_pool(engine, size: int) -> None:
+    """Open a few pooled connections so the first requests skip the connect handshake."""
+    try:
+        # Hold every connection until all are open; checking them in one at a time
+        # would just hand the same pooled connection back each iteration.
+        with ExitStack() as stack:
+            for _ in range(size):
+                stack.enter_context(engine.connect())
+    except Exception as exc:  # Best effort: requests will connect lazily instead.
+        logger.warning("Could not pre-open database connections: {}", exc)
+    else:
+        logger.info("Opened {} pooled database connections", size)
+
+
+def dispose_db():
+    global _engine, SessionLocal
+    if _engine is None:
+        return
+    _engine.dispose()
+    _engine = None
+    SessionLocal = None
+    logger.info("Database connection pool closed")
 
 def get_db():
-    settings = get_settings()
-    if settings.environment == "test":
+    if _IS_TEST:
         yield None
         return
     if SessionLocal is None:
@@ -54,8 +99,7 @@ def get_db():
 _in_memory_datastore = InMemoryDataStore()
 
 def get_datastore(db: Session = None) -> Datastore:
-    settings = get_settings()
-    if settings.environment == "test":
+    if _IS_TEST:
         return _in_memory_datastore
     if db:
         return PostgresDataStore(db)
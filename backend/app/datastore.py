@@ -1,13 +1,18 @@
 from __future__ import annotations
 
+import bisect
+import itertools
 from collections import defaultdict
+from contextlib import contextmanager
 from datetime import datetime
-from typing import Any, Callable, Dict, List, Optional, Protocol
+from typing import Any, Callable, ContextManager, Dict, Iterator, List, Optional, Protocol, Sequence, Type, TypeVar
 
 from loguru import logger
-from sqlalchemy import delete, select
-from sqlalchemy.orm import Session, joinedload
+from pydantic import BaseModel
+from sqlalchemy import bindparam, delete, lambda_stmt, select, update
+from sqlalchemy.orm import Session, selectinload
 
+from .cache import TTLCache
 from .logging_utils import log_call
 from .models import Friend, Game, GameAggregate, GamePhase, GameStatus, Log, Player, User, utc_now
 from .orm_models import (
@@ -21,8 +26,11 @@ from .orm_models import (
 
 
 class Datastore(Protocol):
+    # Credential lookup: the only read that returns the stored password hash.
     def get_user_by_username(self, username: str) -> User | None: ...
-    def get_user_by_id(self, user_id: int) -> User | None: ...
+    # Request-context lookup: password_hash is always "". Stores may serve it from a
+    # short-lived cache; pass cached=False when the result drives a write.
+    def get_user_by_id(self, user_id: int, *, cached: bool = True) -> User | None: ...
     def create_user(self, username: str, password_hash: str) -> User: ...
     def update_user(self, user_id: int, **changes: Any) -> User | None: ...
     def list_friends(self, user_id: int) -> List[Friend]: ...
@@ -60,90 +68,221 @@ class Datastore(Protocol):
         avatar: str | None,
         friend_id: int | None,
     ) -> Player: ...
+    def add_players(self, game_id: str, players: List[Dict[str, Any]]) -> List[Player]: ...
     def update_player(self, player_id: int, game_id: str, **changes: Any) -> Player | None: ...
     def get_player(self, game_id: str, player_id: int) -> Player | None: ...
     def list_players(self, game_id: str) -> List[Player]: ...
     def add_log(self, game_id: str, *, round: int, phase: GamePhase, message: str, timestamp: datetime | None = None) -> Log: ...
     def list_logs(self, game_id: str) -> List[Log]: ...
     def get_game_bundle(self, game_id: str) -> GameAggregate | None: ...
+    def get_game_bundles(self, game_ids: List[str]) -> List[GameAggregate]: ...
     def reset_user_data(self, user_id: int) -> None: ...
     def reset(self) -> None: ...
+    def unit_of_work(self) -> ContextManager[None]: ...
+
+# get_user_by_id runs on every authenticated request but users change rarely.
+# Entries never hold the password hash, and credential lookups by username always
+# read the database. Updates evict entries in this process once committed; other
+# workers see changes when the short TTL lapses.
+_USER_CACHE_TTL = 5.0  # seconds
+_USER_CACHE_MAXSIZE = 10_000
+_users_by_id: TTLCache[User] = TTLCache(_USER_CACHE_MAXSIZE, _USER_CACHE_TTL)
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+
+def _columns_for(orm_cls: type, model: Type[BaseModel]) -> tuple:
+    return tuple(getattr(orm_cls, name) for name in model.model_fields)
+
+
+# List queries select only the columns each model needs and skip per-field
+# validation: values coming back from typed columns are already the right types.
+_FRIEND_COLUMNS = _columns_for(FriendDb, Friend)
+_GAME_COLUMNS = _columns_for(GameDb, Game)
+_PLAYER_COLUMNS = _columns_for(PlayerDb, Player)
+_LOG_COLUMNS = _columns_for(LogDb, Log)
+
+
+# Point lookups run on nearly every request; lambda statements are built and
+# cache-keyed once here instead of reconstructing the select() on each call.
+_USER_BY_ID = lambda_stmt(lambda: select(UserDb).where(UserDb.id == bindparam("user_id")))
+_USER_BY_USERNAME = lambda_stmt(lambda: select(UserDb).where(UserDb.username == bindparam("username")))
+_FRIEND_FOR_USER = lambda_stmt(
+    lambda: select(FriendDb).where(FriendDb.id == bindparam("friend_id"), FriendDb.user_id == bindparam("user_id"))
+)
+_GAME_BY_ID = lambda_stmt(lambda: select(GameDb).where(GameDb.id == bindparam("game_id")))
+_PLAYER_IN_GAME = lambda_stmt(
+    lambda: select(PlayerDb).where(PlayerDb.id == bindparam("player_id"), PlayerDb.game_id == bindparam("game_id"))
+)
+
+
+def _log_sort_key(log: Log) -> tuple[datetime, int]:
+    return log.timestamp, log.id
+
+
+def _bundle_from_db(game_db: GameDb) -> GameAggregate:
+    # Bound once per bundle rather than resolved on the class for every row.
+    validate_player = Player.model_validate
+    validate_log = Log.model_validate
+    return GameAggregate(
+        game=Game.model_validate(game_db),
+        players=[validate_player(p) for p in game_db.players],
+        logs=[validate_log(l) for l in game_db.logs],
+    )
+
+
+def _player_row(game_id: str, *, name: str, avatar: str | None, friend_id: int | None) -> PlayerDb:
+    return PlayerDb(
+        game_id=game_id,
+        name=name,
+        is_alive=True,
+        public_is_alive=True,
+        avatar=avatar,
+        friend_id=friend_id,
+    )
+
+
+def _construct_all(model: Type[ModelT], rows: Sequence[Any]) -> List[ModelT]:
+    construct = model.model_construct
+    return [construct(**row) for row in rows]
 
 
 class PostgresDataStore:
     def __init__(self, session: Session):
         self.session = session
         self._cache_invalidator: Optional[Callable[[str], None]] = None
+        self._unit_of_work_depth = 0
+        self._pending_invalidations: set[str] = set()
+        self._pending_user_evictions: set[int] = set()
+
+    def _commit(self) -> None:
+        # Inside unit_of_work() writes are only flushed; the outermost block commits once.
+        if self._unit_of_work_depth:
+            self.session.flush()
+        else:
+            self.session.commit()
+
+    @contextmanager
+    def unit_of_work(self) -> Iterator[None]:
+        """Group several datastore writes into a single transaction and commit."""
+        self._unit_of_work_depth += 1
+        try:
+            yield
+        except Exception:
+            self._unit_of_work_depth -= 1
+            if not self._unit_of_work_depth:
+                self.session.rollback()
+                # Nothing was committed, so cached game state is still current. Users
+                # are evicted anyway: a read inside the block may have cached a flushed row.
+                self._pending_invalidations.clear()
+                self._evict_pending_users()
+            raise
+        self._unit_of_work_depth -= 1
+        if not self._unit_of_work_depth:
+            self.session.commit()
+            self._evict_pending_users()
+            pending, self._pending_invalidations = self._pending_invalidations, set()
+            for game_id in pending:
+                self._notify_invalidator(game_id)
 
     def set_cache_invalidator(self, callback: Optional[Callable[[str], None]]) -> None:
         self._cache_invalidator = callback
 
     def _invalidate_game_cache(self, game_id: str) -> None:
-        if self._cache_invalidator is not None:
-            try:
-                self._cache_invalidator(game_id)
-            except Exception as exc:
-                logger.exception("Cache invalidation callback failed for game %s: %s", game_id, exc)
+        if self._cache_invalidator is None:
+            return
+        if self._unit_of_work_depth:
+            # Coalesce repeated writes to one game and only evict once they are committed.
+            self._pending_invalidations.add(game_id)
+        else:
+            self._notify_invalidator(game_id)
+
+    def _notify_invalidator(self, game_id: str) -> None:
+        try:
+            self._cache_invalidator(game_id)
+        except Exception as exc:
+            logger.exception("Cache invalidation callback failed for game %s: %s", game_id, exc)
+
+    def _evict_pending_users(self) -> None:
+        pending, self._pending_user_evictions = self._pending_user_evictions, set()
+        for user_id in pending:
+            _users_by_id.pop(user_id)
+
+    def _evict_cached_user(self, user_id: int) -> None:
+        if self._unit_of_work_depth:
+            # Evicting before the commit would let a concurrent read re-cache the old row.
+            self._pending_user_evictions.add(user_id)
+        else:
+            _users_by_id.pop(user_id)
 
     @log_call("datastore.postgres")
     def get_user_by_username(self, username: str) -> User | None:
-        user_db = self.session.execute(select(UserDb).where(UserDb.username == username)).scalar_one_or_none()
+        # Used for credential checks, so always read the current row.
+        user_db = self.session.execute(_USER_BY_USERNAME, {"username": username}).scalar_one_or_none()
         return User.model_validate(user_db) if user_db else None
 
     @log_call("datastore.postgres")
-    def get_user_by_id(self, user_id: int) -> User | None:
-        user_db = self.session.execute(select(UserDb).where(UserDb.id == user_id)).scalar_one_or_none()
-        return User.model_validate(user_db) if user_db else None
+    def get_user_by_id(self, user_id: int, *, cached: bool = True) -> User | None:
+        """Fetch a user for request context; the returned ``password_hash`` is always empty."""
+        if cached:
+            entry = _users_by_id.get(user_id)
+            if entry is not None:
+                # Hand out a copy so callers can't mutate the shared entry.
+                return entry.model_copy()
+        user_db = self.session.execute(_USER_BY_ID, {"user_id": user_id}).scalar_one_or_none()
+        if not user_db:
+            return None
+        user = User.model_validate(user_db).model_copy(update={"password_hash": ""})
+        if cached:
+            _users_by_id.set(user_id, user)
+            return user.model_copy()
+        return user
 
     @log_call("datastore.postgres")
     def create_user(self, username: str, password_hash: str) -> User:
         user_db = UserDb(username=username, password_hash=password_hash)
         self.session.add(user_db)
-        self.session.commit()
-        self.session.refresh(user_db)
+        self._commit()
         return User.model_validate(user_db)
 
     @log_call("datastore.postgres")
     def update_user(self, user_id: int, **changes: Any) -> User | None:
-        user_db = self.session.execute(select(UserDb).where(UserDb.id == user_id)).scalar_one_or_none()
+        user_db = self.session.execute(_USER_BY_ID, {"user_id": user_id}).scalar_one_or_none()
         if not user_db:
             return None
         for key, value in changes.items():
             setattr(user_db, key, value)
-        self.session.commit()
-        self.session.refresh(user_db)
+        self._commit()
+        self._evict_cached_user(user_id)
         return User.model_validate(user_db)
 
     @log_call("datastore.postgres")
     def list_friends(self, user_id: int) -> List[Friend]:
-        friends_db = self.session.execute(
-            select(FriendDb).where(FriendDb.user_id == user_id).order_by(FriendDb.name)
-        ).scalars().all()
-        return [Friend.model_validate(f) for f in friends_db]
+        rows = self.session.execute(
+            select(*_FRIEND_COLUMNS).where(FriendDb.user_id == user_id).order_by(FriendDb.name)
+        ).mappings().all()
+        return _construct_all(Friend, rows)
 
     @log_call("datastore.postgres")
     def create_friend(self, user_id: int, *, name: str, description: str | None, image: str | None) -> Friend:
         friend_db = FriendDb(user_id=user_id, name=name, description=description, image=image)
         self.session.add(friend_db)
-        self.session.commit()
-        self.session.refresh(friend_db)
+        self._commit()
         return Friend.model_validate(friend_db)
 
     @log_call("datastore.postgres")
     def delete_friend(self, friend_id: int, user_id: int) -> bool:
-        friend_db = self.session.execute(
-            select(FriendDb).where(FriendDb.id == friend_id, FriendDb.user_id == user_id)
-        ).scalar_one_or_none()
-        if not friend_db:
-            return False
-        self.session.delete(friend_db)
-        self.session.commit()
-        return True
+        # The owner check rides along in the WHERE clause, so no SELECT is needed first.
+        result = self.session.execute(
+            delete(FriendDb).where(FriendDb.id == friend_id, FriendDb.user_id == user_id)
+        )
+        self._commit()
+        return result.rowcount > 0
 
     @log_call("datastore.postgres")
     def get_friend_for_user(self, friend_id: int, user_id: int) -> Friend | None:
         friend_db = self.session.execute(
-            select(FriendDb).where(FriendDb.id == friend_id, FriendDb.user_id == user_id)
+            _FRIEND_FOR_USER, {"friend_id": friend_id, "user_id": user_id}
         ).scalar_one_or_none()
         return Friend.model_validate(friend_db) if friend_db else None
 
@@ -166,24 +305,24 @@ class PostgresDataStore:
             winning_team=winning_team,
         )
         self.session.add(game_db)
-        self.session.commit()
-        self.session.refresh(game_db)
+        self._commit()
         return Game.model_validate(game_db)
 
     @log_call("datastore.postgres")
     def get_game(self, game_id: str) -> Game | None:
-        game_db = self.session.execute(select(GameDb).where(GameDb.id == game_id)).scalar_one_or_none()
+        game_db = self.session.execute(_GAME_BY_ID, {"game_id": game_id}).scalar_one_or_none()
         return Game.model_validate(game_db) if game_db else None
 
     @log_call("datastore.postgres")
     def update_game(self, game_id: str, **changes: Any) -> Game | None:
-        game_db = self.session.execute(select(GameDb).where(GameDb.id == game_id)).scalar_one_or_none()
+        if not changes:
+            return self.get_game(game_id)
+        game_db = self.session.execute(
+            update(GameDb).where(GameDb.id == game_id).values(**changes).returning(GameDb)
+        ).scalar_one_or_none()
+        self._commit()
         if not game_db:
             return None
-        for key, value in changes.items():
-            setattr(game_db, key, value)
-        self.session.commit()
-        self.session.refresh(game_db)
         self._invalidate_game_cache(game_id)
         return Game.model_validate(game_db)
 
@@ -198,13 +337,17 @@ class PostgresDataStore:
         log_message: str,
         timestamp: datetime | None = None,
     ) -> tuple[Game | None, Log | None]:
-        game_db = self.session.execute(select(GameDb).where(GameDb.id == game_id)).scalar_one_or_none()
+        if changes:
+            # UPDATE ... RETURNING both applies the changes and hands back the row.
+            stmt = update(GameDb).where(GameDb.id == game_id).values(**changes).returning(GameDb)
+        else:
+            stmt = select(GameDb).where(GameDb.id == game_id)
+        game_db = self.session.execute(stmt).scalar_one_or_none()
         if not game_db:
             return None, None
 
-        for key, value in changes.items():
-            setattr(game_db, key, value)
-
+        # Every column is set client-side and the id comes back from the INSERT,
+        # so the log needs no refresh after commit.
         log_db = LogDb(
             game_id=game_id,
             round=log_round,
@@ -213,20 +356,17 @@ class PostgresDataStore:
             timestamp=timestamp or utc_now(),
         )
         self.session.add(log_db)
-        self.session.commit()
-        self.session.refresh(game_db)
-        self.session.refresh(log_db)
+        self._commit()
 
         self._invalidate_game_cache(game_id)
         return Game.model_validate(game_db), Log.model_validate(log_db)
 
     @log_call("datastore.postgres")
     def list_games(self, host_id: int, status_filter: GameStatus | None = None) -> List[Game]:
-        stmt = select(GameDb).where(GameDb.host_id == host_id).order_by(GameDb.id.desc())
+        stmt = select(*_GAME_COLUMNS).where(GameDb.host_id == host_id).order_by(GameDb.id.desc())
         if status_filter is not None:
             stmt = stmt.where(GameDb.status == status_filter)
-        games_db = self.session.execute(stmt).scalars().all()
-        return [Game.model_validate(g) for g in games_db]
+        return _construct_all(Game, self.session.execute(stmt).mappings().all())
 
     @log_call("datastore.postgres")
     def delete_game(self, game_id: str, host_id: int) -> bool:
@@ -238,7 +378,7 @@ class PostgresDataStore:
         self.session.execute(delete(PlayerDb).where(PlayerDb.game_id == game_id))
         self.session.execute(delete(LogDb).where(LogDb.game_id == game_id))
         self.session.delete(game_db)
-        self.session.commit()
+        self._commit()
         self._invalidate_game_cache(game_id)
         return True
 
@@ -251,47 +391,56 @@ class PostgresDataStore:
         avatar: str | None,
         friend_id: int | None,
     ) -> Player:
-        player_db = PlayerDb(
-            game_id=game_id,
-            name=name,
-            is_alive=True,
-            public_is_alive=True,
-            avatar=avatar,
-            friend_id=friend_id,
-        )
+        player_db = _player_row(game_id, name=name, avatar=avatar, friend_id=friend_id)
         self.session.add(player_db)
-        self.session.commit()
-        self.session.refresh(player_db)
+        self._commit()
         self._invalidate_game_cache(game_id)
         return Player.model_validate(player_db)
 
+    @log_call("datastore.postgres")
+    def add_players(self, game_id: str, players: List[Dict[str, Any]]) -> List[Player]:
+        """Insert several players with a single commit; each dict holds name, avatar and friend_id."""
+        players_db = [
+            _player_row(game_id, name=player["name"], avatar=player.get("avatar"), friend_id=player.get("friend_id"))
+            for player in players
+        ]
+        if not players_db:
+            return []
+        self.session.add_all(players_db)
+        self._commit()
+        self._invalidate_game_cache(game_id)
+        return [Player.model_validate(p) for p in players_db]
+
     @log_call("datastore.postgres")
     def update_player(self, player_id: int, game_id: str, **changes: Any) -> Player | None:
+        if not changes:
+            return self.get_player(game_id, player_id)
+        # UPDATE ... RETURNING replaces the SELECT / UPDATE / refresh round trips.
         player_db = self.session.execute(
-            select(PlayerDb).where(PlayerDb.id == player_id, PlayerDb.game_id == game_id)
+            update(PlayerDb)
+            .where(PlayerDb.id == player_id, PlayerDb.game_id == game_id)
+            .values(**changes)
+            .returning(PlayerDb)
         ).scalar_one_or_none()
+        self._commit()
         if not player_db:
             return None
-        for key, value in changes.items():
-            setattr(player_db, key, value)
-        self.session.commit()
-        self.session.refresh(player_db)
         self._invalidate_game_cache(game_id)
         return Player.model_validate(player_db)
 
     @log_call("datastore.postgres")
     def get_player(self, game_id: str, player_id: int) -> Player | None:
         player_db = self.session.execute(
-            select(PlayerDb).where(PlayerDb.id == player_id, PlayerDb.game_id == game_id)
+            _PLAYER_IN_GAME, {"player_id": player_id, "game_id": game_id}
         ).scalar_one_or_none()
         return Player.model_validate(player_db) if player_db else None
 
     @log_call("datastore.postgres")
     def list_players(self, game_id: str) -> List[Player]:
-        players_db = self.session.execute(
-            select(PlayerDb).where(PlayerDb.game_id == game_id).order_by(PlayerDb.id)
-        ).scalars().all()
-        return [Player.model_validate(p) for p in players_db]
+        rows = self.session.execute(
+            select(*_PLAYER_COLUMNS).where(PlayerDb.game_id == game_id).order_by(PlayerDb.id)
+        ).mappings().all()
+        return _construct_all(Player, rows)
 
     @log_call("datastore.postgres")
     def add_log(self, game_id: str, *, round: int, phase: GamePhase, message: str, timestamp: datetime | None = None) -> Log:
@@ -303,31 +452,39 @@ class PostgresDataStore:
             timestamp=timestamp or utc_now(),
         )
         self.session.add(log_db)
-        self.session.commit()
-        self.session.refresh(log_db)
+        self._commit()
         self._invalidate_game_cache(game_id)
         return Log.model_validate(log_db)
 
     @log_call("datastore.postgres")
     def list_logs(self, game_id: str) -> List[Log]:
-        logs_db = self.session.execute(
-            select(LogDb).where(LogDb.game_id == game_id).order_by(LogDb.timestamp)
-        ).scalars().all()
-        return [Log.model_validate(l) for l in logs_db]
+        rows = self.session.execute(
+            select(*_LOG_COLUMNS).where(LogDb.game_id == game_id).order_by(LogDb.timestamp)
+        ).mappings().all()
+        return _construct_all(Log, rows)
 
     @log_call("datastore.postgres")
     def get_game_bundle(self, game_id: str) -> GameAggregate | None:
+        # Separate IN queries avoid the players x logs row product a double join returns.
         game_db = self.session.execute(
             select(GameDb)
-            .options(joinedload(GameDb.players), joinedload(GameDb.logs))
+            .options(selectinload(GameDb.players), selectinload(GameDb.logs))
             .where(GameDb.id == game_id)
-        ).unique().scalar_one_or_none()
-        if not game_db:
-            return None
-        game = Game.model_validate(game_db)
-        players = [Player.model_validate(p) for p in game_db.players]
-        logs = [Log.model_validate(l) for l in game_db.logs]
-        return GameAggregate(game=game, players=players, logs=logs)
+        ).scalar_one_or_none()
+        return _bundle_from_db(game_db) if game_db else None
+
+    @log_call("datastore.postgres")
+    def get_game_bundles(self, game_ids: List[str]) -> List[GameAggregate]:
+        if not game_ids:
+            return []
+        # selectinload keeps this at three queries regardless of how many games are requested.
+        games_db = self.session.execute(
+            select(GameDb)
+            .options(selectinload(GameDb.players), selectinload(GameDb.logs))
+            .where(GameDb.id.in_(game_ids))
+        ).scalars().all()
+        games_by_id = {g.id: g for g in games_db}
+        return [_bundle_from_db(games_by_id[game_id]) for game_id in game_ids if game_id in games_by_id]
 
     @log_call("datastore.postgres")
     def reset_user_data(self, user_id: int) -> None:
@@ -339,7 +496,7 @@ class PostgresDataStore:
             self.session.execute(delete(LogDb).where(LogDb.game_id.in_(game_ids)))
             self.session.execute(delete(GameDb).where(GameDb.id.in_(game_ids)))
         self.session.execute(delete(FriendDb).where(FriendDb.user_id == user_id))
-        self.session.commit()
+        self._commit()
 
     def reset(self) -> None:
         pass
@@ -357,13 +514,26 @@ class InMemoryDataStore:
         self._friends: Dict[int, Friend] = {}
         self._games: Dict[str, Game] = {}
         self._players: Dict[int, Player] = {}
-        self._logs: Dict[int, Log] = {}
-        self._counters: defaultdict[str, int] = defaultdict(int)
+        # Secondary indexes so list_* touch only the matching rows. Player ids are
+        # kept in id order as they are written. Logs are never updated or looked up
+        # by id, so each game's list holds them directly in (timestamp, id) order.
+        self._friends_by_user: defaultdict[int, set[int]] = defaultdict(set)
+        self._games_by_host: defaultdict[int, set[str]] = defaultdict(set)
+        self._players_by_game: defaultdict[str, list[int]] = defaultdict(list)
+        self._logs_by_game: defaultdict[str, list[Log]] = defaultdict(list)
+        self._counters: Dict[str, Iterator[int]] = {}
 
     @log_call("datastore.memory")
     def _next_id(self, collection_name: str) -> int:
-        self._counters[collection_name] += 1
-        return self._counters[collection_name]
+        counter = self._counters.get(collection_name)
+        if counter is None:
+            counter = self._counters[collection_name] = itertools.count(1)
+        return next(counter)
+
+    @contextmanager
+    def unit_of_work(self) -> Iterator[None]:
+        # Writes apply immediately in memory; there is no transaction to defer.
+        yield
 
     def set_cache_invalidator(self, callback: Optional[Callable[[str], None]]) -> None:
         self._cache_invalidator = callback
@@ -375,6 +545,18 @@ class InMemoryDataStore:
             except Exception as exc:
                 logger.exception("Cache invalidation callback failed for game %s: %s", game_id, exc)
 
+    def _reindex_game_host(self, before: Game, after: Game) -> None:
+        if before.host_id != after.host_id:
+            self._games_by_host[before.host_id].discard(after.id)
+            self._games_by_host[after.host_id].add(after.id)
+
+    def _drop_game(self, game: Game) -> None:
+        for player_id in self._players_by_game.pop(game.id, ()):
+            del self._players[player_id]
+        self._logs_by_game.pop(game.id, None)
+        self._games_by_host[game.host_id].discard(game.id)
+        del self._games[game.id]
+
     @log_call("datastore.memory")
     def get_user_by_username(self, username: str) -> User | None:
         user_id = self._usernames.get(username)
@@ -383,8 +565,10 @@ class InMemoryDataStore:
         return self._users.get(user_id)
 
     @log_call("datastore.memory")
-    def get_user_by_id(self, user_id: int) -> User | None:
-        return self._users.get(user_id)
+    def get_user_by_id(self, user_id: int, *, cached: bool = True) -> User | None:
+        user = self._users.get(user_id)
+        # Same contract as the SQL store: only the username lookup exposes the hash.
+        return user.model_copy(update={"password_hash": ""}) if user else None
 
     @log_call("datastore.memory")
     def create_user(self, username: str, password_hash: str) -> User:
@@ -407,7 +591,7 @@ class InMemoryDataStore:
 
     @log_call("datastore.memory")
     def list_friends(self, user_id: int) -> List[Friend]:
-        friends = [friend for friend in self._friends.values() if friend.user_id == user_id]
+        friends = [self._friends[fid] for fid in self._friends_by_user.get(user_id, ())]
         return sorted(friends, key=lambda f: f.name.lower())
 
     @log_call("datastore.memory")
@@ -415,6 +599,7 @@ class InMemoryDataStore:
         friend_id = self._next_id("friends")
         friend = Friend(id=friend_id, user_id=user_id, name=name, description=description, image=image)
         self._friends[friend_id] = friend
+        self._friends_by_user[user_id].add(friend_id)
         return friend
 
     @log_call("datastore.memory")
@@ -423,6 +608,7 @@ class InMemoryDataStore:
         if not friend or friend.user_id != user_id:
             return False
         del self._friends[friend_id]
+        self._friends_by_user[user_id].discard(friend_id)
         return True
 
     @log_call("datastore.memory")
@@ -453,6 +639,7 @@ class InMemoryDataStore:
             created_at=utc_now(),
         )
         self._games[game_id] = game
+        self._games_by_host[host_id].add(game_id)
         self._invalidate_game_cache(game_id)
         return game
 
@@ -467,6 +654,7 @@ class InMemoryDataStore:
             return None
         updated_game = game.model_copy(update=changes)
         self._games[game_id] = updated_game
+        self._reindex_game_host(game, updated_game)
         self._invalidate_game_cache(game_id)
         return updated_game
 
@@ -487,6 +675,7 @@ class InMemoryDataStore:
 
         updated = game.model_copy(update=changes)
         self._games[game_id] = updated
+        self._reindex_game_host(game, updated)
 
         log_entry = self.add_log(
             game_id,
@@ -501,7 +690,7 @@ class InMemoryDataStore:
 
     @log_call("datastore.memory")
     def list_games(self, host_id: int, status_filter: GameStatus | None = None) -> List[Game]:
-        games = [game for game in self._games.values() if game.host_id == host_id]
+        games = [self._games[gid] for gid in self._games_by_host.get(host_id, ())]
         if status_filter is not None:
             games = [game for game in games if game.status == status_filter]
         return sorted(games, key=lambda g: g.id, reverse=True)
@@ -511,14 +700,11 @@ class InMemoryDataStore:
         game = self._games.get(game_id)
         if not game or game.host_id != host_id:
             return False
-        self._players = {pid: p for pid, p in self._players.items() if p.game_id != game_id}
-        self._logs = {lid: l for lid, l in self._logs.items() if l.game_id != game_id}
-        del self._games[game_id]
+        self._drop_game(game)
         self._invalidate_game_cache(game_id)
         return True
 
-    @log_call("datastore.memory")
-    def add_player(self, game_id: str, *, name: str, avatar: str | None, friend_id: int | None) -> Player:
+    def _insert_player(self, game_id: str, *, name: str, avatar: str | None, friend_id: int | None) -> Player:
         player_id = self._next_id("players")
         player = Player(
             id=player_id,
@@ -531,9 +717,25 @@ class InMemoryDataStore:
             friend_id=friend_id,
         )
         self._players[player_id] = player
+        self._players_by_game[game_id].append(player_id)
+        return player
+
+    @log_call("datastore.memory")
+    def add_player(self, game_id: str, *, name: str, avatar: str | None, friend_id: int | None) -> Player:
+        player = self._insert_player(game_id, name=name, avatar=avatar, friend_id=friend_id)
         self._invalidate_game_cache(game_id)
         return player
 
+    @log_call("datastore.memory")
+    def add_players(self, game_id: str, players: List[Dict[str, Any]]) -> List[Player]:
+        created = [
+            self._insert_player(game_id, name=spec["name"], avatar=spec.get("avatar"), friend_id=spec.get("friend_id"))
+            for spec in players
+        ]
+        if created:
+            self._invalidate_game_cache(game_id)
+        return created
+
     @log_call("datastore.memory")
     def update_player(self, player_id: int, game_id: str, **changes: Any) -> Player | None:
         player = self._players.get(player_id)
@@ -553,8 +755,7 @@ class InMemoryDataStore:
 
     @log_call("datastore.memory")
     def list_players(self, game_id: str) -> List[Player]:
-        players = [player for player in self._players.values() if player.game_id == game_id]
-        return sorted(players, key=lambda p: p.id)
+        return [self._players[pid] for pid in self._players_by_game.get(game_id, ())]
 
     @log_call("datastore.memory")
     def add_log(self, game_id: str, *, round: int, phase: GamePhase, message: str, timestamp: datetime | None = None) -> Log:
@@ -568,14 +769,14 @@ class InMemoryDataStore:
             message=message,
             timestamp=ts,
         )
-        self._logs[log_id] = log
+        # Logs almost always arrive in timestamp order, so this is normally an append.
+        bisect.insort(self._logs_by_game[game_id], log, key=_log_sort_key)
         self._invalidate_game_cache(game_id)
         return log
 
     @log_call("datastore.memory")
     def list_logs(self, game_id: str) -> List[Log]:
-        logs = [log for log in self._logs.values() if log.game_id == game_id]
-        return sorted(logs, key=lambda l: (l.timestamp, l.id))
+        return list(self._logs_by_game.get(game_id, ()))
 
     @log_call("datastore.memory")
     def get_game_bundle(self, game_id: str) -> GameAggregate | None:
@@ -586,10 +787,18 @@ class InMemoryDataStore:
         logs = self.list_logs(game_id)
         return GameAggregate(game=game, players=players, logs=logs)
 
+    @log_call("datastore.memory")
+    def get_game_bundles(self, game_ids: List[str]) -> List[GameAggregate]:
+        bundles: List[GameAggregate] = []
+        for game_id in game_ids:
+            bundle = self.get_game_bundle(game_id)
+            if bundle is not None:
+                bundles.append(bundle)
+        return bundles
+
     @log_call("datastore.memory")
     def reset_user_data(self, user_id: int) -> None:
-        game_ids = {g.id for g in self._games.values() if g.host_id == user_id}
-        self._players = {pid: p for pid, p in self._players.items() if p.game_id not in game_ids}
-        self._logs = {lid: l for lid, l in self._logs.items() if l.game_id not in game_ids}
-        self._games = {gid: g for gid, g in self._games.items() if gid not in game_ids}
-        self._friends = {fid: f for fid, f in self._friends.items() if f.user_id != user_id}
+        for game_id in list(self._games_by_host.get(user_id, ())):
+            self._drop_game(self._games[game_id])
+        for friend_id in self._friends_by_user.pop(user_id, ()):
+            del self._friends[friend_id]
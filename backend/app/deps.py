@@ -4,6 +4,7 @@ from fastapi import Depends, HTTPException, Request, status
 from loguru import logger
 
 from .database import get_datastore, get_db
+from .logging_utils import DEBUG_LOGGING_ENABLED
 from .models import User
 from .security import AUTH_COOKIE_NAME, TokenExpiredError, TokenInvalidError, decode_token
 from sqlalchemy.orm import Session
@@ -31,5 +32,6 @@ def get_current_user(request: Request, db: Session = Depends(get_db)) -> User:
     if not user:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="User not found")
 
-    logger.bind(user_id=user_id).debug("Resolved current user")
+    if DEBUG_LOGGING_ENABLED:
+        logger.bind(user_id=user_id).debug("Resolved current user")
     return user
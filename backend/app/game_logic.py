@@ -9,41 +9,60 @@ GOOD_ROLES = {"Villager", "Doctor", "Detective", "Jester", "Survivor", "Executio
 
 # Precompute lowercase role sets to avoid recomputation on every function call
 MAFIA_ROLES_LOWER = {role.lower() for role in MAFIA_ROLES}
+JESTER_ROLE, JESTER_ROLE_LOWER = "Jester", "jester"
+EXECUTIONER_ROLE, EXECUTIONER_ROLE_LOWER = "Executioner", "executioner"
 
 
 def alive_players(players: Iterable[Player]) -> list[Player]:
     return [player for player in players if player.is_alive]
 
 
+def is_mafia_role(role: str | None) -> bool:
+    if role is None:
+        return False
+    # Roles normally arrive in their canonical spelling, which needs no lowercasing.
+    if role in MAFIA_ROLES:
+        return True
+    if role in GOOD_ROLES:
+        return False
+    return role.lower() in MAFIA_ROLES_LOWER
+
+
+def _role_is(role: str | None, canonical: str, canonical_lower: str) -> bool:
+    return role == canonical or (role is not None and role.lower() == canonical_lower)
+
+
 def count_mafia(players: Iterable[Player]) -> int:
-    return sum(1 for player in players if player.is_alive and (player.role or "").lower() in MAFIA_ROLES_LOWER)
+    return sum(1 for player in players if player.is_alive and is_mafia_role(player.role))
 
 
 def count_non_mafia(players: Iterable[Player]) -> int:
-    return sum(
-        1
-        for player in players
-        if player.is_alive and (player.role or "").lower() not in MAFIA_ROLES_LOWER
-    )
+    return sum(1 for player in players if player.is_alive and not is_mafia_role(player.role))
 
 
 def resolve_vote_elimination(player: Player, players: Iterable[Player]) -> str | None:
-    role = (player.role or "").lower()
-    if role == "jester":
+    if _role_is(player.role, JESTER_ROLE, JESTER_ROLE_LOWER):
         return "Jester"
     for other in players:
         if (
             other.is_alive
-            and (other.role or "").lower() == "executioner"
             and other.target_player_id == player.id
+            and _role_is(other.role, EXECUTIONER_ROLE, EXECUTIONER_ROLE_LOWER)
         ):
             return "Executioner"
     return None
 
 
 def determine_winner(game: GameAggregate) -> str | None:
-    mafia_alive = count_mafia(game.players)
-    others_alive = count_non_mafia(game.players)
+    # One pass over the roster instead of separate count_mafia / count_non_mafia scans.
+    mafia_alive = others_alive = 0
+    for player in game.players:
+        if not player.is_alive:
+            continue
+        if is_mafia_role(player.role):
+            mafia_alive += 1
+        else:
+            others_alive += 1
 
     if mafia_alive == 0:
         return "Villagers"
@@ -2,13 +2,14 @@ from __future__ import annotations
 
 import inspect
 import logging
+import re
 import sys
 from functools import wraps
 from typing import Any, Callable, Mapping
 
 from loguru import logger
 
-from .config import get_settings
+from .config import settings
 
 _DEV_FORMAT = "<green>{time:YYYY-MM-DD HH:mm:ss.SSS}</green> | " \
     "<level>{level: <8}</level> | " \
@@ -17,11 +18,22 @@ _DEV_FORMAT = "<green>{time:YYYY-MM-DD HH:mm:ss.SSS}</green> | " \
 
 _PROD_FORMAT = "{time:YYYY-MM-DDTHH:mm:ss.SSSZ} | {level} | {message}"
 _SENSITIVE_KEYS = {"password", "secret", "token", "credential", "key"}
+_SENSITIVE_PATTERN = re.compile("|".join(sorted(_SENSITIVE_KEYS)), re.IGNORECASE)
+_SCALAR_TYPES = (str, int, float, bool, type(None))
+# Template placeholder for required parameters the call did not pass.
+_UNBOUND = object()
+_ENVIRONMENT_LOG_LEVELS = {"development": "DEBUG", "test": "DEBUG", "staging": "INFO"}
+_LOG_LEVEL = _ENVIRONMENT_LOG_LEVELS.get(settings.environment, "WARNING")
+# Lets hot paths skip building bound loggers whose debug records would be dropped.
+DEBUG_LOGGING_ENABLED = _LOG_LEVEL == "DEBUG"
 
 
 def _sanitize(value: Any) -> Any:
+    # Most logged arguments are ids and names; return those before the container checks.
+    if isinstance(value, _SCALAR_TYPES):
+        return value
     if isinstance(value, Mapping):
-        return {k: _sanitize("***" if any(token in k.lower() for token in _SENSITIVE_KEYS) else v) for k, v in value.items()}
+        return {k: "***" if _SENSITIVE_PATTERN.search(k) else _sanitize(v) for k, v in value.items()}
     if isinstance(value, (list, tuple, set)):
         collection_type = type(value)
         return collection_type(_sanitize(item) for item in value)
@@ -37,15 +49,12 @@ def _sanitize(value: Any) -> Any:
 def configure_logging() -> None:
     """Configure Loguru logging based on the active environment."""
 
-    settings = get_settings()
     logger.remove()
 
-    if settings.environment in {"development", "test"}:
+    if DEBUG_LOGGING_ENABLED:
         logger.add(sys.stdout, level="DEBUG", format=_DEV_FORMAT, backtrace=True, diagnose=True, enqueue=True)
-    elif settings.environment == "staging":
-        logger.add(sys.stdout, level="INFO", format=_PROD_FORMAT, backtrace=False, diagnose=False, enqueue=True)
     else:
-        logger.add(sys.stdout, level="WARNING", format=_PROD_FORMAT, backtrace=False, diagnose=False, enqueue=True)
+        logger.add(sys.stdout, level=_LOG_LEVEL, format=_PROD_FORMAT, backtrace=False, diagnose=False, enqueue=True)
 
     class InterceptHandler(logging.Handler):
         def emit(self, record: logging.LogRecord) -> None:  # pragma: no cover - thin shim
@@ -66,25 +75,82 @@ def configure_logging() -> None:
         logging.getLogger(uvicorn_logger).propagate = True
 
 
+def _argument_collector(signature: inspect.Signature) -> Callable[[tuple, dict], dict[str, Any]]:
+    """Build a cheap equivalent of ``bind_partial`` + ``apply_defaults`` for one signature."""
+    template: dict[str, Any] = {}
+    positional: list[str] = []
+    var_positional = var_keyword = None
+    for name, param in signature.parameters.items():
+        if param.kind is param.VAR_POSITIONAL:
+            var_positional = name
+            template[name] = ()
+        elif param.kind is param.VAR_KEYWORD:
+            var_keyword = name
+            template[name] = {}
+        else:
+            template[name] = _UNBOUND if param.default is param.empty else param.default
+            if param.kind in (param.POSITIONAL_ONLY, param.POSITIONAL_OR_KEYWORD):
+                positional.append(name)
+    named = frozenset(template) - {var_positional, var_keyword}
+    positional_count = len(positional)
+    has_required = any(value is _UNBOUND for value in template.values())
+
+    def collect(args: tuple, kwargs: dict) -> dict[str, Any]:
+        # Copying the template keeps arguments in signature order, as bind() would.
+        arguments = dict(template)
+        arguments.update(zip(positional, args))
+        if var_positional is not None:
+            arguments[var_positional] = args[positional_count:]
+        if var_keyword is None:
+            arguments.update(kwargs)
+        else:
+            extra = {}
+            for key, value in kwargs.items():
+                if key in named:
+                    arguments[key] = value
+                else:
+                    extra[key] = value
+            arguments[var_keyword] = extra
+        arguments.pop("self", None)
+        if has_required:
+            # bind_partial leaves out required parameters that were not passed.
+            return {key: value for key, value in arguments.items() if value is not _UNBOUND}
+        return arguments
+
+    return collect
+
+
 def log_call(category: str | None = None) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
     """Decorator that emits debug logs when the wrapped callable executes."""
 
     def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
+        category_logger = logger.bind(category=category or func.__qualname__)
+
+        if not DEBUG_LOGGING_ENABLED:
+            # Entry/exit traces would be dropped by the sink; only keep the error record.
+            @wraps(func)
+            def error_logging_wrapper(*args: Any, **kwargs: Any) -> Any:
+                try:
+                    return func(*args, **kwargs)
+                except Exception:
+                    category_logger.exception("Error in {}", func.__qualname__)
+                    raise
+
+            return error_logging_wrapper
+
         signature = inspect.signature(func)
-        log_category = category or func.__qualname__
+        collect_arguments = _argument_collector(signature)
 
         @wraps(func)
         def wrapper(*args: Any, **kwargs: Any) -> Any:
-            bound = signature.bind_partial(*args, **kwargs)
-            bound.apply_defaults()
-            payload = {k: v for k, v in bound.arguments.items() if k != "self"}
-            logger.bind(category=log_category).debug("Entering {func} with args={args}", func=func.__qualname__, args=_sanitize(payload))
+            payload = collect_arguments(args, kwargs)
+            category_logger.debug("Entering {func} with args={args}", func=func.__qualname__, args=_sanitize(payload))
             try:
                 result = func(*args, **kwargs)
             except Exception:
-                logger.bind(category=log_category).exception("Error in {}", func.__qualname__)
+                category_logger.exception("Error in {}", func.__qualname__)
                 raise
-            logger.bind(category=log_category).debug(
+            category_logger.debug(
                 "Completed {} -> {}",
                 func.__qualname__,
                 getattr(type(result), "__name__", type(result).__name__ if result is not None else "None"),
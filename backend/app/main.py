@@ -4,6 +4,7 @@ import asyncio
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI, WebSocket
+from fastapi.responses import ORJSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 from slowapi import Limiter, _rate_limit_exceeded_handler
 from slowapi.errors import RateLimitExceeded
@@ -13,15 +14,14 @@ from starlette.websockets import WebSocketDisconnect
 
 from loguru import logger
 
-from .config import get_settings
-from .database import get_datastore, init_db, get_db
+from .config import settings
+from .database import dispose_db, get_datastore, init_db, get_db
 from .logging_utils import configure_logging
 from .router_registry import include_routers
 from .services.game_service import GameService, register_event_loop
 from .socket_manager import manager
 
 configure_logging()
-settings = get_settings()
 
 logger.bind(environment=settings.environment).info("Booting MafiaDesk backend")
 
@@ -36,9 +36,10 @@ async def lifespan(app: FastAPI):
     await asyncio.to_thread(init_db)
     logger.info("Database ready in {:.2f}s", asyncio.get_event_loop().time() - t0)
     yield
+    await asyncio.to_thread(dispose_db)
 
 
-app = FastAPI(title="MafiaDesk", version="1.0.0", lifespan=lifespan)
+app = FastAPI(title="MafiaDesk", version="1.0.0", lifespan=lifespan, default_response_class=ORJSONResponse)
 app.state.limiter = limiter
 app.add_exception_handler(RateLimitExceeded, _rate_limit_exceeded_handler)
 app.add_middleware(SlowAPIMiddleware)
@@ -67,25 +68,34 @@ async def websocket_endpoint(
 ) -> None:
     await manager.connect(game_id, websocket)
 
-    # Acquire DB only for the initial state broadcast, then release immediately.
-    db_gen = get_db()
-    db = next(db_gen)
-    try:
-        datastore = get_datastore(db)
-        game_service = GameService(datastore)
-        game_manager = game_service.get_game_manager(game_id)
-        if game_manager:
-            await manager.broadcast(game_id, game_manager.serialize_for_broadcast("init"))
-    finally:
+    snapshot = manager.get_init_snapshot(game_id)
+    if snapshot is None:
+        generation = manager.snapshot_generation()
+        # Acquire DB only for the initial state broadcast, then release immediately.
+        db_gen = get_db()
+        db = next(db_gen)
         try:
-            next(db_gen)
-        except StopIteration:
-            pass
-
-    # Hold the socket open without occupying a DB connection.
+            datastore = get_datastore(db)
+            game_service = GameService(datastore)
+            game_manager = game_service.get_game_manager(game_id)
+            if game_manager:
+                snapshot = manager.store_init_snapshot(
+                    game_id, generation, game_manager.serialize_for_broadcast("init")
+                )
+        finally:
+            try:
+                next(db_gen)
+            except StopIteration:
+                pass
+    if snapshot is not None:
+        await manager.broadcast_text(game_id, snapshot)
+
+    # Hold the socket open without occupying a DB connection. Clients never send
+    # payloads, so frames are read raw (text or binary) and only a disconnect matters.
     try:
-        while True:
-            await websocket.receive_text()
+        while (await websocket.receive())["type"] != "websocket.disconnect":
+            pass
+        manager.disconnect(game_id, websocket)
     except WebSocketDisconnect:
         manager.disconnect(game_id, websocket)
     except Exception:  # pragma: no cover - safety net for unexpected websocket failures
@@ -3,7 +3,7 @@ from __future__ import annotations
 import secrets
 import string
 
-from sqlalchemy import Boolean, Column, DateTime, Enum, ForeignKey, Integer, String
+from sqlalchemy import Boolean, Column, DateTime, Enum, ForeignKey, Index, Integer, String
 from sqlalchemy.orm import declarative_base, relationship
 
 from .models import GamePhase, GameStatus, utc_now
@@ -46,12 +46,13 @@ class GameDb(Base):
     winning_team = Column(String, nullable=True)
     created_at = Column(DateTime(timezone=True), default=utc_now, nullable=True)
     host = relationship("UserDb")
-    players = relationship("PlayerDb", back_populates="game")
-    logs = relationship("LogDb", back_populates="game")
+    players = relationship("PlayerDb", back_populates="game", order_by="PlayerDb.id")
+    logs = relationship("LogDb", back_populates="game", order_by="LogDb.timestamp")
 
 
 class PlayerDb(Base):
     __tablename__ = "players"
+    __table_args__ = (Index("ix_players_game_id_id", "game_id", "id"),)
     id = Column(Integer, primary_key=True, index=True)
     game_id = Column(String(6), ForeignKey("games.id"))
     name = Column(String)
@@ -67,6 +68,7 @@ class PlayerDb(Base):
 
 class LogDb(Base):
     __tablename__ = "logs"
+    __table_args__ = (Index("ix_logs_game_ts", "game_id", "timestamp"),)
     id = Column(Integer, primary_key=True, index=True)
     game_id = Column(String(6), ForeignKey("games.id"))
     round = Column(Integer)
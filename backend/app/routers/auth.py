@@ -9,12 +9,13 @@ from sqlalchemy import select
 from sqlalchemy.orm import Session
 
 from .. import schemas
-from ..config import get_settings
+from ..config import settings
 from ..database import get_datastore, get_db
 from ..deps import get_current_user
 from ..models import User, utc_now
 from ..orm_models import DemoUserStateDb, UserDb
 from ..security import create_access_token, hash_password, set_auth_cookie, verify_password
+from ..socket_manager import manager
 
 router = APIRouter(prefix="/auth", tags=["auth"])
 
@@ -116,8 +117,6 @@ def demo_login(
     request: Request,
     db: Session = Depends(get_db),
 ) -> schemas.UserRead:
-    settings = get_settings()
-
     if not settings.demo_user_enabled:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Demo login is not available")
 
@@ -204,4 +203,9 @@ def update_preferences(
     if not updated:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found")
 
+    if "public_auto_sync_enabled" in changes:
+        # Cached init messages were rendered with the old visibility setting.
+        for game in datastore.list_games(current_user.id):
+            manager.invalidate_init_snapshot(game.id)
+
     return schemas.UserRead.model_validate(updated)
@@ -6,7 +6,7 @@ from sqlalchemy.orm import Session
 
 from ..database import get_datastore, get_db
 from ..deps import get_current_user
-from ..game_logic import MAFIA_ROLES_LOWER
+from ..game_logic import is_mafia_role
 from ..models import GameStatus, User
 
 router = APIRouter(prefix="/stats", tags=["stats"])
@@ -36,17 +36,15 @@ def get_leaderboard(
     played: dict[int, int] = {f.id: 0 for f in friends}
 
     finished_games = datastore.list_games(current_user.id, status_filter=GameStatus.FINISHED)
-    for game in finished_games:
-        bundle = datastore.get_game_bundle(game.id)
-        if bundle is None or bundle.winning_team is None:
+    for bundle in datastore.get_game_bundles([game.id for game in finished_games]):
+        if bundle.winning_team is None:
             continue
         winning_team = bundle.winning_team.lower()
         for player in bundle.players:
             if player.friend_id is None or player.friend_id not in friend_map:
                 continue
             played[player.friend_id] = played.get(player.friend_id, 0) + 1
-            role_lower = (player.role or "").lower()
-            is_mafia = role_lower in MAFIA_ROLES_LOWER
+            is_mafia = is_mafia_role(player.role)
             if (is_mafia and winning_team == "mafia") or (not is_mafia and winning_team != "mafia"):
                 wins[player.friend_id] = wins.get(player.friend_id, 0) + 1
 
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import time
 from datetime import datetime, timedelta, timezone
 from typing import Any, Dict
 
@@ -7,12 +8,18 @@ import bcrypt
 import jwt as pyjwt
 from fastapi import Request, Response
 
-from .config import get_settings
+from .cache import TTLCache
+from .config import settings
 
-settings = get_settings()
 AUTH_COOKIE_NAME = "mafia_session"
 BCRYPT_MAX_BYTES = 72
 
+# Session cookies are long-lived and sent on every request, so verified payloads
+# are reused briefly instead of re-checking the signature each time.
+_TOKEN_CACHE_TTL = 60.0  # seconds
+_TOKEN_CACHE_MAXSIZE = 4096
+_decoded_tokens: TTLCache[Dict[str, Any]] = TTLCache(_TOKEN_CACHE_MAXSIZE, _TOKEN_CACHE_TTL)
+
 
 def _ensure_bcrypt_safe(password: str) -> str:
     if len(password.encode("utf-8")) > BCRYPT_MAX_BYTES:
@@ -35,7 +42,7 @@ def create_access_token(data: Dict[str, Any], expires_delta: timedelta | None =
     to_encode = data.copy()
     if "sub" in to_encode:
         to_encode["sub"] = str(to_encode["sub"])
-    expire = datetime.now(timezone.utc) + (expires_delta or timedelta(minutes=settings.access_token_expire_minutes))
+    expire = datetime.now(timezone.utc) + (expires_delta or settings.access_token_expire_delta)
     to_encode.update({"exp": expire})
     return pyjwt.encode(to_encode, settings.secret_key, algorithm=settings.algorithm)
 
@@ -55,12 +62,23 @@ def decode_token(token: str) -> Dict[str, Any]:
         TokenExpiredError: if the token's expiry has passed.
         TokenInvalidError: if the token is malformed or signature is invalid.
     """
+    cached = _decoded_tokens.get(token)
+    if cached is not None:
+        # The cache TTL can outlast the token itself, so expiry is re-checked on every hit.
+        if cached.get("exp", float("inf")) > time.time():
+            # Callers get their own copy so the shared entry can't be mutated.
+            return dict(cached)
+        _decoded_tokens.pop(token)
+        raise TokenExpiredError("Token has expired")
+
     try:
-        return pyjwt.decode(token, settings.secret_key, algorithms=[settings.algorithm])
+        payload = pyjwt.decode(token, settings.secret_key, algorithms=[settings.algorithm])
     except pyjwt.ExpiredSignatureError as exc:
         raise TokenExpiredError("Token has expired") from exc
     except pyjwt.PyJWTError as exc:
         raise TokenInvalidError("Token is invalid") from exc
+    _decoded_tokens.set(token, payload)
+    return dict(payload)
 
 
 def _cookie_settings(request: Request | None = None) -> dict[str, Any]:
@@ -20,6 +20,7 @@ from loguru import logger
 from .. import schemas
 from ..datastore import Datastore
 from ..game_logic import determine_winner, resolve_vote_elimination
+from ..logging_utils import DEBUG_LOGGING_ENABLED
 from ..models import Game, GameAggregate, GamePhase, GameStatus, Log, Player, User
 from ..socket_manager import manager
 
@@ -51,7 +52,8 @@ def _serialize_log(log: Log) -> dict:
     return {
         "id": log.id,
         "round": log.round,
-        "phase": log.phase.value,
+        # str-valued enum; orjson writes its value without the .value descriptor call.
+        "phase": log.phase,
         "message": log.message,
         "timestamp": log.timestamp.isoformat(),
     }
@@ -70,7 +72,9 @@ class GameManager:
             "save": self._handle_save_action,
             "investigate": self._handle_investigate_action,
         }
-        host = self.datastore.get_user_by_id(self.bundle.host_id)
+        # The flag decides whether kills are written to public_is_alive, so read it
+        # fresh rather than from a cache another worker's update can't evict.
+        host = self.datastore.get_user_by_id(self.bundle.host_id, cached=False)
         self.public_auto_sync_enabled = getattr(host, "public_auto_sync_enabled", True)
 
     @classmethod
@@ -145,8 +149,8 @@ class GameManager:
         message = {
             "event": event,
             "game_id": self.bundle.id,
-            "status": self.bundle.status.value,
-            "phase": self.bundle.current_phase.value,
+            "status": self.bundle.status,
+            "phase": self.bundle.current_phase,
             "round": self.bundle.current_round,
             "winning_team": self.bundle.winning_team,
             "public_auto_sync_enabled": self.public_auto_sync_enabled,
@@ -162,7 +166,9 @@ class GameManager:
 
     def broadcast(self, event: str, payload: Optional[dict] = None) -> None:
         message = self.serialize_for_broadcast(event, payload)
-        logger.bind(game_id=self.id, event=event).debug("Broadcasting game state update")
+        manager.invalidate_init_snapshot(self.id)
+        if DEBUG_LOGGING_ENABLED:
+            logger.bind(game_id=self.id, event=event).debug("Broadcasting game state update")
         try:
             loop = _app_loop
             if loop is None or not loop.is_running():
@@ -173,15 +179,18 @@ class GameManager:
             logger.exception("Failed to broadcast game state for game {}", self.id)
 
     def assign_roles(self, payload: schemas.AssignRolesRequest) -> None:
-        for assignment in payload.assignments:
-            player = self.player_map.get(assignment.player_id)
-            if not player:
-                raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=f"Invalid player {assignment.player_id}")
-            updated_player = self.datastore.update_player(
-                player.id, self.id, role=assignment.role, target_player_id=assignment.target_player_id
-            )
-            if updated_player:
-                self._replace_player(updated_player)
+        with self.datastore.unit_of_work():
+            for assignment in payload.assignments:
+                player = self.player_map.get(assignment.player_id)
+                if not player:
+                    raise HTTPException(
+                        status_code=status.HTTP_400_BAD_REQUEST, detail=f"Invalid player {assignment.player_id}"
+                    )
+                updated_player = self.datastore.update_player(
+                    player.id, self.id, role=assignment.role, target_player_id=assignment.target_player_id
+                )
+                if updated_player:
+                    self._replace_player(updated_player)
         self.broadcast("roles_assigned")
 
     def start(self) -> None:
@@ -296,24 +305,26 @@ class GameManager:
                 detail="Night actions only allowed during night phase",
             )
 
-        for action in payload.actions:
-            self.process_action(action, defer_winner_check=True)
-            if self.bundle.status == GameStatus.FINISHED:
-                break
-
-        if self.bundle.status == GameStatus.ACTIVE:
-            winner = determine_winner(self.bundle)
-            if winner:
-                updated_game, final_log = self.datastore.update_game_with_log(
-                    self.id,
-                    changes={"status": GameStatus.FINISHED, "winning_team": winner},
-                    log_round=self.bundle.current_round,
-                    log_phase=self.bundle.current_phase,
-                    log_message=f"Game ended. {winner} win!",
-                )
-                if updated_game and final_log:
-                    self.sync_game_state(updated_game)
-                    self.append_log(final_log)
+        # All night actions and the winner check land in one transaction.
+        with self.datastore.unit_of_work():
+            for action in payload.actions:
+                self.process_action(action, defer_winner_check=True)
+                if self.bundle.status == GameStatus.FINISHED:
+                    break
+
+            if self.bundle.status == GameStatus.ACTIVE:
+                winner = determine_winner(self.bundle)
+                if winner:
+                    updated_game, final_log = self.datastore.update_game_with_log(
+                        self.id,
+                        changes={"status": GameStatus.FINISHED, "winning_team": winner},
+                        log_round=self.bundle.current_round,
+                        log_phase=self.bundle.current_phase,
+                        log_message=f"Game ended. {winner} win!",
+                    )
+                    if updated_game and final_log:
+                        self.sync_game_state(updated_game)
+                        self.append_log(final_log)
 
         self.broadcast(
             "night_actions_resolved",
@@ -363,24 +374,25 @@ class GameManager:
             raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Game is not active")
 
         revealed_players: list[int] = []
-        for player in list(self.bundle.players):
-            public_state = getattr(player, "public_is_alive", player.is_alive)
-            if public_state != player.is_alive:
-                updated_player = self.datastore.update_player(
-                    player.id,
-                    self.id,
-                    public_is_alive=player.is_alive,
-                )
-                if updated_player:
-                    self._replace_player(updated_player)
-                    revealed_players.append(player.id)
-
-        log_entry = self.datastore.add_log(
-            self.id,
-            round=self.bundle.current_round,
-            phase=self.bundle.current_phase,
-            message="Night events synced to public view.",
-        )
+        with self.datastore.unit_of_work():
+            for player in list(self.bundle.players):
+                public_state = getattr(player, "public_is_alive", player.is_alive)
+                if public_state != player.is_alive:
+                    updated_player = self.datastore.update_player(
+                        player.id,
+                        self.id,
+                        public_is_alive=player.is_alive,
+                    )
+                    if updated_player:
+                        self._replace_player(updated_player)
+                        revealed_players.append(player.id)
+
+            log_entry = self.datastore.add_log(
+                self.id,
+                round=self.bundle.current_round,
+                phase=self.bundle.current_phase,
+                message="Night events synced to public view.",
+            )
         self.append_log(log_entry)
         self.broadcast("night_synced", {"revealed_player_ids": revealed_players})
 
@@ -400,6 +412,7 @@ class GameService:
 
         players_payload = payload.players or [schemas.PlayerCreate(name=name) for name in payload.player_names]
 
+        new_players: list[dict] = []
         for player_payload in players_payload:
             raw_name = player_payload.name.strip()
             if not raw_name:
@@ -415,14 +428,9 @@ class GameService:
             avatar = (player_payload.avatar or "").strip() or (friend.image or "" if friend else "")
             avatar = avatar or random_animal_avatar()
 
-            player = self.datastore.add_player(
-                game.id,
-                name=name,
-                avatar=avatar,
-                friend_id=friend.id if friend else None,
-            )
-            bundle.players.append(player)
+            new_players.append({"name": name, "avatar": avatar, "friend_id": friend.id if friend else None})
 
+        bundle.players.extend(self.datastore.add_players(game.id, new_players))
         bundle.players.sort(key=lambda p: p.id)
         game_manager.player_map = {p.id: p for p in bundle.players}
         game_manager.broadcast("game_created")
@@ -434,4 +442,5 @@ class GameService:
 
     def delete_game(self, game_id: str, user: User) -> None:
         if not self.datastore.delete_game(game_id, user.id):
-            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Game not found")
\ No newline at end of file
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Game not found")
+        manager.invalidate_init_snapshot(game_id)
\ No newline at end of file
@@ -1,32 +1,98 @@
 from __future__ import annotations
 
+import asyncio
+import itertools
 from collections import defaultdict
-from typing import Any, Dict, List
+from typing import Any, Dict, Set
 
+import orjson
 from fastapi import WebSocket
+from loguru import logger
 from starlette.websockets import WebSocketDisconnect
 
+from .cache import TTLCache
+
+# Encoded "init" messages are reused across connects to the same game. Game state
+# changes evict them explicitly; the short TTL bounds staleness from writes that
+# don't go through this process (e.g. another worker).
+_INIT_SNAPSHOT_TTL = 5.0  # seconds
+_INIT_SNAPSHOT_MAXSIZE = 1024
+# How long a game's last invalidation is remembered; far longer than any init fetch.
+_INVALIDATION_TTL = 60.0  # seconds
+
 
 class ConnectionManager:
     def __init__(self) -> None:
-        self.active_connections: Dict[str, List[WebSocket]] = defaultdict(list)
+        # Everything runs on the server's event loop, so the per-game buckets need no locking.
+        self.active_connections: Dict[str, Set[WebSocket]] = defaultdict(set)
+        self._init_snapshots: TTLCache[str] = TTLCache(_INIT_SNAPSHOT_MAXSIZE, _INIT_SNAPSHOT_TTL)
+        # Stamps come from one counter; each game records the stamp of its last invalidation.
+        self._stamps = itertools.count(1)
+        self._invalidated_at: TTLCache[int] = TTLCache(_INIT_SNAPSHOT_MAXSIZE, _INVALIDATION_TTL)
+
+    def snapshot_generation(self) -> int:
+        """Take a stamp before loading game state for ``store_init_snapshot``."""
+        return next(self._stamps)
+
+    def get_init_snapshot(self, game_id: str) -> str | None:
+        return self._init_snapshots.get(game_id)
+
+    def store_init_snapshot(self, game_id: str, generation: int, message: Dict[str, Any]) -> str:
+        """Encode an init message, caching it unless the game changed since ``generation``."""
+        data = orjson.dumps(message).decode()
+        if not self._invalidated_since(game_id, generation):
+            self._init_snapshots.set(game_id, data)
+            # Invalidations run on request threads; re-check in case one landed mid-store.
+            if self._invalidated_since(game_id, generation):
+                self._init_snapshots.pop(game_id)
+        return data
+
+    def _invalidated_since(self, game_id: str, generation: int) -> bool:
+        invalidated_at = self._invalidated_at.get(game_id)
+        return invalidated_at is not None and invalidated_at > generation
+
+    def invalidate_init_snapshot(self, game_id: str) -> None:
+        self._invalidated_at.set(game_id, next(self._stamps))
+        self._init_snapshots.pop(game_id)
 
     async def connect(self, game_id: str, websocket: WebSocket) -> None:
         await websocket.accept()
-        self.active_connections[game_id].append(websocket)
+        self.active_connections[game_id].add(websocket)
 
     def disconnect(self, game_id: str, websocket: WebSocket) -> None:
-        if websocket in self.active_connections.get(game_id, []):
-            self.active_connections[game_id].remove(websocket)
-        if not self.active_connections[game_id]:
-            self.active_connections.pop(game_id, None)
+        connections = self.active_connections.get(game_id)
+        if connections is None:
+            return
+        connections.discard(websocket)
+        if not connections:
+            del self.active_connections[game_id]
 
     async def broadcast(self, game_id: str, message: Dict[str, Any]) -> None:
-        for connection in list(self.active_connections.get(game_id, [])):
-            try:
-                await connection.send_json(message)
-            except (WebSocketDisconnect, RuntimeError):
-                self.disconnect(game_id, connection)
+        if not self.active_connections.get(game_id):
+            return
+        # Encode once for every subscriber instead of once per socket.
+        await self.broadcast_text(game_id, orjson.dumps(message).decode())
+
+    async def broadcast_text(self, game_id: str, data: str) -> None:
+        connections = self.active_connections.get(game_id)
+        if not connections:
+            return
+        if len(connections) == 1:
+            await self._send_text(game_id, next(iter(connections)), data)
+            return
+        # Send concurrently so one slow client doesn't hold up the rest of the table.
+        await asyncio.gather(*(self._send_text(game_id, connection, data) for connection in list(connections)))
+
+    async def _send_text(self, game_id: str, connection: WebSocket, data: str) -> None:
+        try:
+            await connection.send_text(data)
+        except (WebSocketDisconnect, RuntimeError):
+            self.disconnect(game_id, connection)
+        except Exception:
+            # Any other send failure also means the socket is gone; never let it
+            # escape into the gather and abort delivery to the other sockets.
+            logger.opt(exception=True).warning("Dropping websocket for game {} after send failure", game_id)
+            self.disconnect(game_id, connection)
 
 
 manager = ConnectionManager()
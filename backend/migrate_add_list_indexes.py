@@ -0,0 +1,34 @@
+"""
+Migration: Add composite indexes for per-game player and log lookups.
+
+`list_players` filters on game_id and orders by id; `list_logs` filters on
+game_id and orders by timestamp. These indexes let both run as a single
+index range scan instead of a filter followed by a sort. New databases get
+them from `create_all`; this script adds them to existing ones.
+
+Run once against an existing database:
+    python migrate_add_list_indexes.py
+
+WARNING: Back up your database before running this script.
+"""
+from __future__ import annotations
+
+from sqlalchemy import create_engine, text
+
+from app.config import settings
+
+
+def run() -> None:
+    engine = create_engine(settings.database_url_resolved)
+
+    with engine.begin() as conn:
+        conn.execute(text("CREATE INDEX IF NOT EXISTS ix_players_game_id_id ON players (game_id, id)"))
+        print("Ensured ix_players_game_id_id index exists.")
+        conn.execute(text("CREATE INDEX IF NOT EXISTS ix_logs_game_ts ON logs (game_id, timestamp)"))
+        print("Ensured ix_logs_game_ts index exists.")
+
+    print("Migration complete.")
+
+
+if __name__ == "__main__":
+    run()
@@ -14,12 +14,11 @@ from __future__ import annotations
 
 from sqlalchemy import create_engine, text
 
-from app.config import get_settings
+from app.config import settings
 
 
 def run() -> None:
-    settings = get_settings()
-    engine = create_engine(settings.database_url)
+    engine = create_engine(settings.database_url_resolved)
 
     with engine.begin() as conn:
         conn.execute(text(
@@ -18,7 +18,7 @@ import secrets
 import string
 from sqlalchemy import create_engine, text
 
-from app.config import get_settings
+from app.config import settings
 
 _ALPHABET = string.ascii_uppercase + string.digits
 
@@ -32,8 +32,7 @@ def _new_code(used: set[str]) -> str:
 
 
 def run() -> None:
-    settings = get_settings()
-    engine = create_engine(settings.database_url)
+    engine = create_engine(settings.database_url_resolved)
 
     with engine.begin() as conn:
         # Always-run schema additions
@@ -0,0 +1,29 @@
+from __future__ import annotations
+
+import os
+
+# Settings are bound once at import of app.config, so the environment must be
+# in place before any test module pulls in the app package.
+os.environ.setdefault("APP_ENVIRONMENT", "test")
+
+from typing import Iterator  # noqa: E402
+
+import pytest  # noqa: E402
+from sqlalchemy import create_engine  # noqa: E402
+from sqlalchemy.orm import sessionmaker  # noqa: E402
+
+from app.datastore import PostgresDataStore, _users_by_id  # noqa: E402
+from app.orm_models import Base  # noqa: E402
+
+
+@pytest.fixture()
+def sql_datastore() -> Iterator[PostgresDataStore]:
+    """The SQLAlchemy-backed store on an in-memory SQLite database."""
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine, autoflush=False, expire_on_commit=False)()
+    _users_by_id.clear()
+    yield PostgresDataStore(session)
+    session.close()
+    engine.dispose()
+    _users_by_id.clear()
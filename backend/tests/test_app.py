@@ -6,10 +6,8 @@ import pytest
 os.environ["APP_ENVIRONMENT"] = "test"
 
 from fastapi.testclient import TestClient
-from app.config import get_settings
-get_settings.cache_clear()
-
 from app.main import app
+from app.socket_manager import manager
 from app.database import init_db
 
 init_db()
@@ -115,4 +113,21 @@ def test_full_flow(test_client: TestClient) -> None:
 
     resp = test_client.post(f"/games/{game_id}/finish", json={"winning_team": "Villagers"})
     assert resp.status_code == 200
-    assert resp.json()["status"] == "finished"
\ No newline at end of file
+    assert resp.json()["status"] == "finished"
+
+
+def test_visibility_preference_change_invalidates_init_snapshots(test_client: TestClient) -> None:
+    test_client.post("/auth/signup", json={"username": "host", "password": "password123"})
+    resp = test_client.post("/games/new", json={"player_names": ["Alice", "Bob"]})
+    game_id = resp.json()["id"]
+
+    with test_client.websocket_connect(f"/ws/game/{game_id}") as websocket:
+        assert '"public_auto_sync_enabled":true' in websocket.receive_text()
+    assert manager.get_init_snapshot(game_id) is not None
+
+    resp = test_client.patch("/auth/me/preferences", json={"public_auto_sync_enabled": False})
+    assert resp.status_code == 200
+    assert manager.get_init_snapshot(game_id) is None
+
+    with test_client.websocket_connect(f"/ws/game/{game_id}") as websocket:
+        assert '"public_auto_sync_enabled":false' in websocket.receive_text()
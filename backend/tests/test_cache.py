@@ -0,0 +1,35 @@
+from __future__ import annotations
+
+import time
+from types import SimpleNamespace
+
+from app import cache
+
+
+def test_ttl_cache_evicts_oldest_entry_when_full():
+    ttl_cache = cache.TTLCache(maxsize=2, ttl=60)
+    ttl_cache.set("a", 1)
+    ttl_cache.set("b", 2)
+    ttl_cache.set("a", 10)  # re-setting refreshes the entry's position
+    ttl_cache.set("c", 3)
+
+    assert ttl_cache.get("b") is None
+    assert (ttl_cache.get("a"), ttl_cache.get("c")) == (10, 3)
+
+
+def test_ttl_cache_expires_entries(monkeypatch):
+    ttl_cache = cache.TTLCache(maxsize=4, ttl=5)
+    now = time.monotonic()
+    clock = SimpleNamespace(monotonic=lambda: now)
+    monkeypatch.setattr(cache, "time", clock)
+    ttl_cache.set("a", 1)
+
+    clock.monotonic = lambda: now + 4.9
+    assert ttl_cache.get("a") == 1
+    clock.monotonic = lambda: now + 5
+    assert ttl_cache.get("a") is None
+
+    ttl_cache.set("b", 2)
+    ttl_cache.pop("b")
+    ttl_cache.pop("missing")
+    assert ttl_cache.get("b") is None
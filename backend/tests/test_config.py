@@ -0,0 +1,42 @@
+from __future__ import annotations
+
+import pytest
+from pydantic import ValidationError
+
+from app.config import Settings
+
+
+def test_settings_read_only_prefixed_environment_variables(monkeypatch) -> None:
+    monkeypatch.setenv("APP_ACCESS_TOKEN_EXPIRE_MINUTES", "7")
+    monkeypatch.setenv("DEMO_USER_TTL_HOURS", "99")
+
+    loaded = Settings()
+
+    assert loaded.environment == "test"
+    assert loaded.access_token_expire_minutes == 7
+    assert loaded.demo_user_ttl_hours == 24
+
+
+@pytest.mark.parametrize(
+    ("name", "value"),
+    [("APP_ENVIRONMENT", "prod"), ("APP_AUTH_COOKIE_SAMESITE", "sometimes")],
+)
+def test_settings_reject_unknown_choices(monkeypatch, name: str, value: str) -> None:
+    monkeypatch.setenv(name, value)
+
+    with pytest.raises(ValidationError):
+        Settings()
+
+
+def test_database_url_is_only_required_when_resolved(monkeypatch) -> None:
+    for name in ("URL", "HOST", "PORT", "USER", "PASSWORD", "NAME"):
+        monkeypatch.delenv(f"APP_DATABASE_{name}", raising=False)
+    monkeypatch.setenv("APP_DATABASE_HOST", "db.internal")
+
+    loaded = Settings()
+
+    dumped = loaded.model_dump()
+    assert "database_url_resolved" not in dumped
+    assert "access_token_expire_delta" not in dumped
+    with pytest.raises(ValueError, match="APP_DATABASE_PORT"):
+        loaded.database_url_resolved
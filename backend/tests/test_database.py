@@ -1,9 +1,17 @@
 from __future__ import annotations
 
+import time
+from datetime import datetime
+from types import SimpleNamespace
+
 import pytest
+from sqlalchemy import event, select, update
+from sqlalchemy.exc import CompileError
 
-from app.datastore import InMemoryDataStore
-from app.models import GamePhase, GameStatus
+from app import cache
+from app.datastore import InMemoryDataStore, PostgresDataStore, _users_by_id
+from app.models import Friend, Game, GamePhase, GameStatus, Log, Player
+from app.orm_models import FriendDb, GameDb, LogDb, PlayerDb, UserDb
 
 
 @pytest.fixture()
@@ -13,6 +21,12 @@ def datastore() -> InMemoryDataStore:
     return store
 
 
+def _count_statements(store: PostgresDataStore) -> list[str]:
+    statements: list[str] = []
+    event.listen(store.session.get_bind(), "before_cursor_execute", lambda *args: statements.append(args[2]))
+    return statements
+
+
 def test_create_user(datastore):
     user = datastore.create_user("testuser", "password")
     assert user.username == "testuser"
@@ -95,3 +109,272 @@ def test_reset_user_data(datastore):
 
     assert datastore.list_games(user.id) == []
     assert datastore.list_friends(user.id) == []
+
+
+def test_get_game_bundles(datastore):
+    user = datastore.create_user("testuser", "password")
+    first = datastore.create_game(user.id)
+    second = datastore.create_game(user.id)
+    datastore.add_player(first.id, name="Alice", avatar=None, friend_id=None)
+
+    bundles = datastore.get_game_bundles([second.id, "NOPE00", first.id])
+    assert [bundle.id for bundle in bundles] == [second.id, first.id]
+    assert len(bundles[1].players) == 1
+
+
+def test_delete_game_removes_players_and_logs(datastore):
+    user = datastore.create_user("testuser", "password")
+    kept = datastore.create_game(user.id)
+    removed = datastore.create_game(user.id)
+    datastore.add_player(kept.id, name="Alice", avatar=None, friend_id=None)
+    datastore.add_player(removed.id, name="Bob", avatar=None, friend_id=None)
+    datastore.add_log(removed.id, round=1, phase=GamePhase.DAY, message="bye")
+
+    assert datastore.delete_game(removed.id, user.id) is True
+
+    assert [game.id for game in datastore.list_games(user.id)] == [kept.id]
+    assert datastore.list_players(removed.id) == []
+    assert datastore.list_logs(removed.id) == []
+    assert len(datastore.list_players(kept.id)) == 1
+
+
+def test_sql_user_lookup_by_id_is_cached_without_password_hash(sql_datastore):
+    user = sql_datastore.create_user("host", "hashed")
+    statements = _count_statements(sql_datastore)
+
+    first = sql_datastore.get_user_by_id(user.id)
+    first.username = "mutated"
+    second = sql_datastore.get_user_by_id(user.id)
+
+    assert len(statements) == 1
+    assert second.username == "host"
+    assert second.password_hash == ""
+
+
+def test_sql_user_lookup_by_username_always_reads_current_hash(sql_datastore):
+    user = sql_datastore.create_user("host", "old-hash")
+    sql_datastore.get_user_by_id(user.id)
+
+    sql_datastore.update_user(user.id, password_hash="new-hash")
+
+    assert sql_datastore.get_user_by_username("host").password_hash == "new-hash"
+
+
+def test_sql_update_user_evicts_cached_user(sql_datastore):
+    user = sql_datastore.create_user("host", "hashed")
+    assert sql_datastore.get_user_by_id(user.id).public_auto_sync_enabled is True
+
+    sql_datastore.update_user(user.id, public_auto_sync_enabled=False)
+
+    assert sql_datastore.get_user_by_id(user.id).public_auto_sync_enabled is False
+
+
+def test_sql_update_user_evicts_only_after_unit_of_work_commits(sql_datastore):
+    user = sql_datastore.create_user("host", "hashed")
+    sql_datastore.get_user_by_id(user.id)
+
+    with sql_datastore.unit_of_work():
+        sql_datastore.update_user(user.id, public_auto_sync_enabled=False)
+        assert _users_by_id.get(user.id).public_auto_sync_enabled is True
+
+    assert _users_by_id.get(user.id) is None
+    assert sql_datastore.get_user_by_id(user.id).public_auto_sync_enabled is False
+
+
+def test_sql_cached_user_expires_after_ttl(sql_datastore, monkeypatch):
+    user = sql_datastore.create_user("host", "hashed")
+    sql_datastore.get_user_by_id(user.id)
+    statements = _count_statements(sql_datastore)
+
+    later = time.monotonic() + _users_by_id.ttl + 1
+    monkeypatch.setattr(cache, "time", SimpleNamespace(monotonic=lambda: later))
+    sql_datastore.get_user_by_id(user.id)
+
+    assert len(statements) == 1
+
+
+def test_sql_update_game_returns_updated_row(sql_datastore):
+    user = sql_datastore.create_user("host", "hashed")
+    game = sql_datastore.create_game(user.id)
+
+    updated = sql_datastore.update_game(game.id, status=GameStatus.ACTIVE, current_round=3)
+
+    assert updated.status == GameStatus.ACTIVE
+    assert updated.current_round == 3
+    assert updated.host_id == user.id
+    assert updated.created_at is not None
+    assert sql_datastore.get_game(game.id) == updated
+    assert sql_datastore.update_game(game.id) == updated
+
+
+def test_sql_update_on_missing_rows_returns_none(sql_datastore):
+    user = sql_datastore.create_user("host", "hashed")
+    game = sql_datastore.create_game(user.id)
+    other = sql_datastore.create_game(user.id)
+    player = sql_datastore.add_player(game.id, name="Alice", avatar=None, friend_id=None)
+
+    assert sql_datastore.update_game("NOPE00", status=GameStatus.ACTIVE) is None
+    assert sql_datastore.update_player(player.id + 1, game.id, role="Mafia") is None
+    assert sql_datastore.update_player(player.id, other.id, role="Mafia") is None
+    assert sql_datastore.update_game_with_log(
+        "NOPE00", changes={"current_round": 2}, log_round=2, log_phase=GamePhase.DAY, log_message="x"
+    ) == (None, None)
+    assert sql_datastore.get_player(game.id, player.id).role is None
+    assert sql_datastore.list_logs("NOPE00") == []
+
+
+def test_sql_update_player_returns_updated_row(sql_datastore):
+    user = sql_datastore.create_user("host", "hashed")
+    game = sql_datastore.create_game(user.id)
+    player = sql_datastore.add_player(game.id, name="Alice", avatar="fox", friend_id=None)
+
+    updated = sql_datastore.update_player(player.id, game.id, role="Mafia", is_alive=False)
+
+    assert (updated.role, updated.is_alive, updated.public_is_alive) == ("Mafia", False, True)
+    assert (updated.name, updated.avatar) == ("Alice", "fox")
+    assert sql_datastore.get_player(game.id, player.id) == updated
+
+
+def test_sql_update_game_with_log_writes_both(sql_datastore):
+    user = sql_datastore.create_user("host", "hashed")
+    game = sql_datastore.create_game(user.id)
+
+    updated, log = sql_datastore.update_game_with_log(
+        game.id,
+        changes={"current_phase": GamePhase.NIGHT, "current_round": 2},
+        log_round=2,
+        log_phase=GamePhase.NIGHT,
+        log_message="Night falls",
+    )
+
+    assert (updated.current_phase, updated.current_round) == (GamePhase.NIGHT, 2)
+    assert log.id is not None and log.game_id == game.id and log.message == "Night falls"
+    assert [(entry.id, entry.message) for entry in sql_datastore.list_logs(game.id)] == [(log.id, log.message)]
+    assert sql_datastore.get_game(game.id) == updated
+
+
+def test_sql_update_rejects_unknown_columns(sql_datastore):
+    user = sql_datastore.create_user("host", "hashed")
+    game = sql_datastore.create_game(user.id)
+
+    # The old setattr path silently dropped unknown keys; UPDATE names every column.
+    with pytest.raises(CompileError):
+        sql_datastore.update_game(game.id, not_a_column=1)
+
+
+def test_sql_unit_of_work_commits_once_at_the_outermost_block(sql_datastore):
+    user = sql_datastore.create_user("host", "hashed")
+    game = sql_datastore.create_game(user.id)
+    invalidated: list[str] = []
+    sql_datastore.set_cache_invalidator(invalidated.append)
+    commits: list[None] = []
+    event.listen(sql_datastore.session, "after_commit", lambda session: commits.append(None))
+
+    with sql_datastore.unit_of_work():
+        sql_datastore.update_game(game.id, status=GameStatus.ACTIVE)
+        with sql_datastore.unit_of_work():
+            sql_datastore.add_log(game.id, round=1, phase=GamePhase.DAY, message="nested")
+        assert commits == [] and invalidated == []
+
+    assert len(commits) == 1
+    assert invalidated == [game.id]
+    assert sql_datastore.get_game(game.id).status == GameStatus.ACTIVE
+
+
+def test_sql_unit_of_work_rolls_back_nested_writes_without_invalidating(sql_datastore):
+    user = sql_datastore.create_user("host", "hashed")
+    game = sql_datastore.create_game(user.id)
+    player = sql_datastore.add_player(game.id, name="Alice", avatar=None, friend_id=None)
+    invalidated: list[str] = []
+    sql_datastore.set_cache_invalidator(invalidated.append)
+
+    with pytest.raises(RuntimeError):
+        with sql_datastore.unit_of_work():
+            sql_datastore.update_player(player.id, game.id, role="Mafia")
+            with sql_datastore.unit_of_work():
+                sql_datastore.add_log(game.id, round=1, phase=GamePhase.DAY, message="lost")
+                raise RuntimeError("boom")
+
+    assert invalidated == []
+    assert sql_datastore.get_player(game.id, player.id).role is None
+    assert sql_datastore.list_logs(game.id) == []
+
+    # The store is usable again and a plain write notifies immediately.
+    sql_datastore.update_player(player.id, game.id, role="Doctor")
+    assert invalidated == [game.id]
+
+
+def test_sql_list_results_match_validated_models(sql_datastore):
+    user = sql_datastore.create_user("host", "hashed")
+    game = sql_datastore.create_game(user.id)
+    sql_datastore.update_game(game.id, status=GameStatus.FINISHED, winning_team="Mafia")
+    sql_datastore.create_friend(user.id, name="Bob", description="quiet", image=None)
+    sql_datastore.add_players(game.id, [{"name": "Alice"}, {"name": "Bob", "avatar": "bear"}])
+    sql_datastore.add_log(game.id, round=1, phase=GamePhase.NIGHT, message="night")
+
+    def validated(model, orm_cls):
+        sql_datastore.session.expire_all()
+        rows = sql_datastore.session.execute(select(orm_cls)).scalars().all()
+        return [model.model_validate(row) for row in rows]
+
+    # List queries build models with model_construct; the result, datetimes included,
+    # must be indistinguishable from full validation.
+    assert sql_datastore.list_games(user.id) == validated(Game, GameDb)
+    assert sql_datastore.list_friends(user.id) == validated(Friend, FriendDb)
+    assert sql_datastore.list_players(game.id) == validated(Player, PlayerDb)
+    assert sql_datastore.list_logs(game.id) == validated(Log, LogDb)
+    game_row = sql_datastore.list_games(user.id)[0]
+    assert isinstance(game_row.created_at, datetime) and isinstance(game_row.status, GameStatus)
+    assert isinstance(sql_datastore.list_logs(game.id)[0].timestamp, datetime)
+
+
+@pytest.mark.parametrize("store_fixture", ["datastore", "sql_datastore"])
+def test_add_players_matches_single_inserts(request, store_fixture):
+    store = request.getfixturevalue(store_fixture)
+    user = store.create_user("host", "hashed")
+    friend = store.create_friend(user.id, name="Alice", description=None, image=None)
+    specs = [
+        {"name": "Alice", "avatar": "fox", "friend_id": friend.id},
+        {"name": "Bob"},
+    ]
+    single_game = store.create_game(user.id)
+    batch_game = store.create_game(user.id)
+
+    singles = [
+        store.add_player(
+            single_game.id, name=spec["name"], avatar=spec.get("avatar"), friend_id=spec.get("friend_id")
+        )
+        for spec in specs
+    ]
+    batch = store.add_players(batch_game.id, specs)
+
+    def comparable(players):
+        return [player.model_dump(exclude={"id", "game_id"}) for player in players]
+
+    assert comparable(batch) == comparable(singles)
+    assert comparable(store.list_players(batch_game.id)) == comparable(store.list_players(single_game.id))
+    assert all(player.game_id == batch_game.id and player.id is not None for player in batch)
+
+
+@pytest.mark.parametrize("store_fixture", ["datastore", "sql_datastore"])
+def test_only_username_lookup_returns_password_hash(request, store_fixture):
+    store = request.getfixturevalue(store_fixture)
+    user = store.create_user("host", "hashed")
+
+    assert store.get_user_by_id(user.id).password_hash == ""
+    assert store.get_user_by_id(user.id, cached=False).password_hash == ""
+    assert store.get_user_by_username("host").password_hash == "hashed"
+
+
+def test_sql_uncached_user_lookup_sees_writes_from_other_workers(sql_datastore):
+    user = sql_datastore.create_user("host", "hashed")
+    sql_datastore.get_user_by_id(user.id)
+
+    # Another process commits without evicting this process's cache.
+    sql_datastore.session.execute(
+        update(UserDb).where(UserDb.id == user.id).values(public_auto_sync_enabled=False)
+    )
+    sql_datastore.session.commit()
+
+    assert sql_datastore.get_user_by_id(user.id).public_auto_sync_enabled is True
+    assert sql_datastore.get_user_by_id(user.id, cached=False).public_auto_sync_enabled is False
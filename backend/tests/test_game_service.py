@@ -4,9 +4,11 @@ from unittest.mock import Mock, patch
 
 import pytest
 from fastapi import HTTPException
+from sqlalchemy import update
 
 from app.datastore import InMemoryDataStore
 from app.models import GamePhase, GameStatus, User
+from app.orm_models import UserDb
 from app.schemas import (
     AssignRolesRequest,
     FinishGameRequest,
@@ -169,4 +171,36 @@ def test_doctor_self_save_survives_mafia_kill(game_service: GameService, test_us
     doctor_after = manager.player_map[doctor.id]
     assert doctor_after.is_alive, "Doctor should survive their own self-save"
     assert manager.bundle.status == GameStatus.ACTIVE, "Game should still be active"
-    assert manager.bundle.winning_team is None, "No winner should be declared yet"
\ No newline at end of file
+    assert manager.bundle.winning_team is None, "No winner should be declared yet"
+
+
+def test_voting_out_last_mafia_ends_game(created_game: GameManager):
+    players = created_game.bundle.players
+    assignments = [
+        {"player_id": players[0].id, "role": "mafia"},
+        {"player_id": players[1].id, "role": "Villager"},
+        {"player_id": players[2].id, "role": "Doctor"},
+        {"player_id": players[3].id, "role": "Villager"},
+    ]
+    created_game.assign_roles(AssignRolesRequest(assignments=assignments))
+    created_game.start()
+
+    created_game.process_action(GameActionRequest(action_type="vote", target_player_id=players[0].id))
+
+    assert created_game.bundle.status == GameStatus.FINISHED
+    assert created_game.bundle.winning_team == "Villagers"
+
+
+def test_game_manager_reads_host_visibility_uncached(sql_datastore):
+    host = sql_datastore.create_user("host", "hashed")
+    game = sql_datastore.create_game(host.id)
+    assert sql_datastore.get_user_by_id(host.id).public_auto_sync_enabled is True
+
+    # Simulate another worker turning auto-sync off: the row changes, this cache doesn't.
+    sql_datastore.session.execute(
+        update(UserDb).where(UserDb.id == host.id).values(public_auto_sync_enabled=False)
+    )
+    sql_datastore.session.commit()
+
+    manager = GameManager.load(game.id, sql_datastore)
+    assert manager.public_auto_sync_enabled is False
@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+import inspect
+
+import pytest
+from loguru import logger
+from pydantic import BaseModel
+
+from app import logging_utils
+
+
+def test_log_call_records_errors_when_debug_logging_is_off(monkeypatch) -> None:
+    monkeypatch.setattr(logging_utils, "DEBUG_LOGGING_ENABLED", False)
+
+    @logging_utils.log_call("tests")
+    def explode() -> None:
+        raise RuntimeError("boom")
+
+    messages = []
+    sink_id = logger.add(messages.append, level="INFO", format="{message}")
+    try:
+        with pytest.raises(RuntimeError):
+            explode()
+    finally:
+        logger.remove(sink_id)
+
+    assert [(m.record["level"].name, m.record["extra"]["category"]) for m in messages] == [("ERROR", "tests")]
+    assert "explode" in messages[0].record["message"]
+
+
+class _Service:
+    def method(self, game_id, name="x", *extra, flag=False, token, **options):
+        return None
+
+
+@pytest.mark.parametrize(
+    ("args", "kwargs"),
+    [
+        ((None, "G1"), {"token": "t"}),
+        ((None, "G1", "n", 1, 2), {"token": "t", "flag": True, "limit": 3}),
+        ((None,), {"game_id": "G1"}),
+        ((None,), {}),
+    ],
+)
+def test_argument_collector_matches_bind_partial(args: tuple, kwargs: dict) -> None:
+    signature = inspect.signature(_Service.method)
+    bound = signature.bind_partial(*args, **kwargs)
+    bound.apply_defaults()
+    expected = {key: value for key, value in bound.arguments.items() if key != "self"}
+
+    collected = logging_utils._argument_collector(signature)(args, kwargs)
+
+    assert collected == expected
+    assert list(collected) == list(expected)
+
+
+class _Credentials(BaseModel):
+    username: str
+    password: str
+
+
+def test_sanitize_masks_sensitive_keys_at_any_depth() -> None:
+    payload = {
+        "game_id": "G1",
+        "API_Key": "k",
+        "password_hash": "h",
+        "items": [{"refresh_token": "r", "round": 2}],
+        "login": _Credentials(username="host", password="p"),
+        "pair": ("a", 1),
+    }
+
+    assert logging_utils._sanitize(payload) == {
+        "game_id": "G1",
+        "API_Key": "***",
+        "password_hash": "***",
+        "items": [{"refresh_token": "***", "round": 2}],
+        "login": {"username": "host", "password": "***"},
+        "pair": ("a", 1),
+    }
+    assert logging_utils._sanitize("password") == "password"
+    assert logging_utils._sanitize(None) is None
@@ -0,0 +1,33 @@
+from __future__ import annotations
+
+import time
+from datetime import timedelta
+from types import SimpleNamespace
+
+import pytest
+
+from app import security
+
+
+def test_decode_token_reuses_verified_payload(monkeypatch) -> None:
+    token = security.create_access_token({"sub": 1})
+    security._decoded_tokens.pop(token)
+    first = security.decode_token(token)
+    first["sub"] = "tampered"
+
+    def fail_decode(*args, **kwargs):
+        raise AssertionError("cached token was decoded again")
+
+    monkeypatch.setattr(security.pyjwt, "decode", fail_decode)
+    assert security.decode_token(token)["sub"] == "1"
+
+
+def test_decode_token_rejects_cached_token_once_expired(monkeypatch) -> None:
+    token = security.create_access_token({"sub": 1}, expires_delta=timedelta(seconds=30))
+    assert security.decode_token(token)["sub"] == "1"
+
+    later = time.time() + 60
+    monkeypatch.setattr(security, "time", SimpleNamespace(time=lambda: later))
+    with pytest.raises(security.TokenExpiredError):
+        security.decode_token(token)
+    assert security._decoded_tokens.get(token) is None
@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+import asyncio
+
+from app.socket_manager import ConnectionManager
+
+
+def test_init_snapshot_is_reused_until_its_game_is_invalidated() -> None:
+    connections = ConnectionManager()
+    generation = connections.snapshot_generation()
+    connections.invalidate_init_snapshot("OTHER1")
+
+    data = connections.store_init_snapshot("GAME01", generation, {"event": "init"})
+    assert connections.get_init_snapshot("GAME01") == data
+
+    connections.invalidate_init_snapshot("GAME01")
+    assert connections.get_init_snapshot("GAME01") is None
+
+
+def test_init_snapshot_loaded_before_an_invalidation_is_not_cached() -> None:
+    connections = ConnectionManager()
+    generation = connections.snapshot_generation()
+    connections.invalidate_init_snapshot("GAME01")
+
+    data = connections.store_init_snapshot("GAME01", generation, {"event": "init"})
+    assert data == '{"event":"init"}'
+    assert connections.get_init_snapshot("GAME01") is None
+
+    fresh_generation = connections.snapshot_generation()
+    connections.store_init_snapshot("GAME01", fresh_generation, {"event": "init"})
+    assert connections.get_init_snapshot("GAME01") == data
+
+
+class _RecordingSocket:
+    def __init__(self, error: Exception | None = None) -> None:
+        self.error = error
+        self.sent: list[str] = []
+
+    async def send_text(self, data: str) -> None:
+        if self.error is not None:
+            raise self.error
+        self.sent.append(data)
+
+
+def test_broadcast_drops_a_failing_socket_and_reaches_the_rest() -> None:
+    connections = ConnectionManager()
+    healthy, broken = _RecordingSocket(), _RecordingSocket(OSError("connection reset"))
+    connections.active_connections["GAME01"].update((healthy, broken))
+
+    asyncio.run(connections.broadcast("GAME01", {"event": "ping"}))
+
+    assert healthy.sent == ['{"event":"ping"}']
+    assert connections.active_connections["GAME01"] == {healthy}